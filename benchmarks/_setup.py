@@ -0,0 +1,21 @@
+"""Shared bootstrap for the benchmark scripts: Django on the test settings."""
+
+import os
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "bharatfd.test_settings")
+
+
+def setup_django(migrate=True, database=None):
+    import django
+    from django.conf import settings
+    from django.core.management import call_command
+
+    if database:
+        # A file database, for benchmarks that use it from several threads
+        settings.DATABASES["default"].update(NAME=database, OPTIONS={"timeout": 30})
+    django.setup()
+    if migrate:
+        call_command("migrate", verbosity=0)
@@ -0,0 +1,103 @@
+"""
+Size of the cached FAQ detail payloads (`faq_detail_*` keys): plain pickles
+of the response data versus the gzipped JSON bodies the view now stores.
+
+    python benchmarks/cache_compression.py [--faqs 1000] [--redis redis://...]
+
+Without --redis the sizes are what django-redis would send to Redis; with it
+the keys are written to that Redis and `used_memory` is compared as well.
+"""
+
+import argparse
+import pickle
+import random
+
+from _setup import setup_django
+
+PARAGRAPH = (
+    'To {verb} your order, open <a href="https://example.com/account/orders">'
+    "My Orders</a>, choose the item and follow the steps shown on screen. "
+    "Refunds reach the original payment method within 5&ndash;7 business days."
+)
+VERBS = ["cancel", "return", "exchange", "track", "reschedule", "modify"]
+HINDI = "अपना ऑर्डर रद्द करने के लिए मेरे ऑर्डर खोलें और स्क्रीन पर दिए गए चरणों का पालन करें।"
+
+
+def realistic_answer(rng):
+    parts = [f"<p>{PARAGRAPH.format(verb=rng.choice(VERBS))}</p>"]
+    parts += [f"<p>{HINDI}</p>"] * rng.randint(0, 2)
+    items = "".join(
+        f"<li><strong>Step {i}:</strong> {PARAGRAPH.format(verb=rng.choice(VERBS))}</li>"
+        for i in range(1, rng.randint(3, 8))
+    )
+    parts.append(f"<ol>{items}</ol>")
+    parts.append('<p><img src="/media/uploads/help/step.png" alt="Step"></p>')
+    return "\n".join(parts)
+
+
+def measure_redis(url, values):
+    import redis
+
+    client = redis.Redis.from_url(url)
+    results = {}
+    for label, payloads in values.items():
+        before = client.info("memory")["used_memory"]
+        keys = [f"bench:{label}:{i}" for i in range(len(payloads))]
+        client.mset(dict(zip(keys, payloads)))
+        results[label] = client.info("memory")["used_memory"] - before
+        client.delete(*keys)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--faqs", type=int, default=1000)
+    parser.add_argument("--redis", help="Redis URL to measure used_memory on")
+    args = parser.parse_args()
+
+    setup_django(migrate=False)
+
+    from faqs.compression import compress_cache_body
+    from faqs.renderers import FastJSONRenderer
+    from faqs.rendering import render_answer
+
+    rng = random.Random(42)
+    payloads = []
+    for i in range(args.faqs):
+        answer_html, _ = render_answer(realistic_answer(rng))
+        payloads.append(
+            {
+                "id": i + 1,
+                "question": f"How do I manage order {i}?",
+                "answer": answer_html,
+            }
+        )
+
+    renderer = FastJSONRenderer()
+    values = {
+        "pickled data": [
+            pickle.dumps(data, pickle.HIGHEST_PROTOCOL) for data in payloads
+        ],
+        "gzipped body": [
+            pickle.dumps(
+                compress_cache_body(renderer.render(data)), pickle.HIGHEST_PROTOCOL
+            )
+            for data in payloads
+        ],
+    }
+
+    baseline = sum(map(len, values["pickled data"]))
+    for label, encoded in values.items():
+        total = sum(map(len, encoded))
+        print(
+            f"{label:>13}: {total / 1024:9.1f} KiB "
+            f"({total / len(encoded):7.1f} B/key, {100 * total / baseline:5.1f}%)"
+        )
+
+    if args.redis:
+        for label, used in measure_redis(args.redis, values).items():
+            print(f"{label:>13}: {used / 1024:9.1f} KiB used_memory")
+
+
+if __name__ == "__main__":
+    main()
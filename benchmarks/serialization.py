@@ -0,0 +1,84 @@
+"""
+Per-item cost of the FAQ read path: FAQSerializer + JSONRenderer versus
+`serialize_faq_rows` + FastJSONRenderer.
+
+    python benchmarks/serialization.py [--faqs 2000] [--repeat 5]
+"""
+
+import argparse
+import time
+
+from _setup import setup_django
+
+
+def seed(count, lang):
+    from faqs.models import FAQ, FAQTranslation
+    from faqs.rendering import render_answer
+
+    answer = "<p>" + "Step by <strong>step</strong> instructions. " * 20 + "</p>"
+    answer_html, answer_text = render_answer(answer)
+    faqs = FAQ.objects.bulk_create(
+        FAQ(
+            question=f"Question {i}?",
+            answer=answer,
+            answer_html=answer_html,
+            answer_text=answer_text,
+        )
+        for i in range(count)
+    )
+    FAQTranslation.objects.bulk_create(
+        FAQTranslation(faq=faq, language=lang, translated_text=f"प्रश्न {faq.id}?")
+        for faq in faqs
+    )
+
+
+def best_of(repeat, fn):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings), result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--faqs", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--lang", default="hi")
+    args = parser.parse_args()
+
+    setup_django()
+
+    from rest_framework.renderers import JSONRenderer
+    from rest_framework.request import Request
+    from rest_framework.test import APIRequestFactory
+
+    from faqs.models import FAQ
+    from faqs.renderers import FastJSONRenderer
+    from faqs.serializers import FAQSerializer, faq_read_values, serialize_faq_rows
+
+    seed(args.faqs, args.lang)
+    request = Request(APIRequestFactory().get("/api/faqs/", {"lang": args.lang}))
+
+    def before():
+        data = FAQSerializer(
+            FAQ.objects.all(), many=True, context={"request": request}
+        ).data
+        return JSONRenderer().render(data)
+
+    def after():
+        rows = faq_read_values(FAQ.objects.all())
+        return FastJSONRenderer().render(serialize_faq_rows(rows, args.lang))
+
+    before_time, before_body = best_of(args.repeat, before)
+    after_time, after_body = best_of(args.repeat, after)
+    assert before_body == after_body, "fast path output differs"
+
+    for label, elapsed in (("before", before_time), ("after", after_time)):
+        print(f"{label:>6}: {elapsed * 1e6 / args.faqs:8.2f} us/item")
+    print(f"speedup: {before_time / after_time:.1f}x ({len(after_body)} bytes)")
+
+
+if __name__ == "__main__":
+    main()
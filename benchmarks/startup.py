@@ -0,0 +1,123 @@
+"""
+Worker start-up cost: app import time (with and without the googletrans stack
+that is now imported lazily) and per-worker memory of gunicorn with and
+without `preload_app`.
+
+    python benchmarks/startup.py [--workers 4] [--repeat 5]
+
+Runs on the test settings, so neither Redis nor a database is needed. Memory
+is read from /proc/<pid>/smaps_rollup (Linux only).
+"""
+
+import argparse
+import os
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+ENV = {**os.environ, "DJANGO_SETTINGS_MODULE": "bharatfd.test_settings"}
+
+IMPORT_APP = "import django; django.setup(); import bharatfd.urls, faqs.tasks"
+IMPORT_CODE = """
+import sys, time
+start = time.perf_counter()
+{imports}
+print(time.perf_counter() - start, "googletrans" in sys.modules)
+"""
+
+
+def import_time(imports, repeat):
+    timings = []
+    for _ in range(repeat):
+        result = subprocess.run(
+            [sys.executable, "-c", IMPORT_CODE.format(imports=imports)],
+            cwd=ROOT,
+            env=ENV,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        elapsed, loaded = result.stdout.split()
+        timings.append(float(elapsed))
+    return min(timings), loaded == "True"
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def children(pid):
+    path = Path(f"/proc/{pid}/task/{pid}/children")
+    return [int(child) for child in path.read_text().split()]
+
+
+def memory_kib(pid):
+    """(RSS, PSS, USS) of `pid` in KiB."""
+    fields = {}
+    for line in Path(f"/proc/{pid}/smaps_rollup").read_text().splitlines()[1:]:
+        name, value = line.split(":")
+        fields[name] = int(value.split()[0])
+    uss = fields["Private_Clean"] + fields["Private_Dirty"]
+    return fields["Rss"], fields["Pss"], uss
+
+
+def gunicorn_memory(preload, workers):
+    with tempfile.NamedTemporaryFile("w", suffix=".py") as config:
+        config.write(
+            f"exec(open({str(ROOT / 'gunicorn.conf.py')!r}).read())\n"
+            f"bind = '127.0.0.1:{free_port()}'\n"
+            f"workers = {workers}\n"
+            f"preload_app = {preload}\n"
+        )
+        config.flush()
+        master = subprocess.Popen(
+            [sys.executable, "-m", "gunicorn", "-c", config.name]
+            + ["bharatfd.wsgi:application"],
+            cwd=ROOT,
+            env=ENV,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        try:
+            deadline = time.monotonic() + 60
+            while len(children(master.pid)) < workers:
+                if time.monotonic() > deadline or master.poll() is not None:
+                    raise RuntimeError("gunicorn workers did not start")
+                time.sleep(0.2)
+            time.sleep(3)  # Let the workers finish loading the app
+            usage = [memory_kib(pid) for pid in children(master.pid)]
+        finally:
+            master.send_signal(signal.SIGTERM)
+            master.wait(timeout=30)
+    return [sum(column) / len(usage) for column in zip(*usage)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print("App import time (best of %d):" % args.repeat)
+    for label, imports in (
+        ("eager googletrans", f"{IMPORT_APP}; import googletrans"),
+        ("lazy googletrans", IMPORT_APP),
+    ):
+        elapsed, loaded = import_time(imports, args.repeat)
+        print(f"  {label:>17}: {elapsed * 1000:6.1f} ms (googletrans loaded: {loaded})")
+
+    print(f"Per-worker memory, {args.workers} workers (KiB):")
+    for label, preload in (("no preload", False), ("preload_app", True)):
+        rss, pss, uss = gunicorn_memory(preload, args.workers)
+        print(f"  {label:>17}: RSS {rss:8.0f}  PSS {pss:8.0f}  USS {uss:8.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""
+Translation tasks per second for each worker pool type, with a stub
+translator that only sleeps (connection setup, then per-request latency).
+
+    python benchmarks/translation_worker.py [--faqs 20] [--concurrency 32]
+
+Each pool runs in its own process: gevent has to monkey-patch before anything
+else is imported and is skipped when it is not installed.
+"""
+
+import argparse
+import subprocess
+import sys
+import time
+
+CONNECT_LATENCY = 0.1  # Creating the translator client (TLS + HTTP/2 setup)
+REQUEST_LATENCY = 0.05  # One translate() round trip
+
+
+class StubTranslator:
+    def __init__(self):
+        time.sleep(CONNECT_LATENCY)
+
+    def translate(self, text, dest="en"):
+        time.sleep(REQUEST_LATENCY)
+
+        class Result:
+            pass
+
+        result = Result()
+        result.text = f"[{dest}] {text}"
+        return result
+
+
+def run(pool, concurrency, window, faq_count):
+    """Run the tasks in-process and print tasks per second."""
+    if pool == "gevent":
+        from gevent import monkey
+
+        monkey.patch_all()
+
+    import tempfile
+    from pathlib import Path
+
+    from _setup import setup_django
+
+    with tempfile.TemporaryDirectory() as tmp:
+        setup_django(database=str(Path(tmp) / "bench.sqlite3"))
+
+        from django.conf import settings
+        from django.db import connection
+
+        from faqs import tasks
+        from faqs.models import FAQ, FAQTranslation
+
+        tasks.get_googletrans_client = StubTranslator
+        # No broker here; snapshot rebuilds are not part of the measurement
+        tasks.schedule_snapshot_builds = lambda site, languages: None
+        tasks.translation_batcher.window = window
+
+        faqs = FAQ.objects.bulk_create(
+            FAQ(question=f"Question {i}?", answer="Answer.") for i in range(faq_count)
+        )
+        jobs = [
+            (faq.id, lang) for faq in faqs for lang in settings.POPULAR_INDIAN_LANGUAGES
+        ]
+        connection.close()
+
+        def job(args):
+            tasks.translate_faq_language(*args)
+
+        start = time.perf_counter()
+        if pool == "solo":
+            for args in jobs:
+                job(args)
+        elif pool == "threads":
+            from concurrent.futures import ThreadPoolExecutor
+
+            with ThreadPoolExecutor(max_workers=concurrency) as executor:
+                list(executor.map(job, jobs))
+        else:
+            from gevent.pool import Pool
+
+            Pool(concurrency).map(job, jobs)
+        elapsed = time.perf_counter() - start
+
+        assert FAQTranslation.objects.count() == len(jobs)
+    print(f"{len(jobs) / elapsed:.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--faqs", type=int, default=20)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--window", type=float, default=0.05)
+    parser.add_argument("--run", nargs=3, metavar=("POOL", "CONCURRENCY", "WINDOW"))
+    args = parser.parse_args()
+
+    if args.run:
+        pool, concurrency, window = args.run
+        run(pool, int(concurrency), float(window), args.faqs)
+        return
+
+    profiles = [("solo", 1, 0)]
+    for pool in ("threads", "gevent"):
+        profiles += [(pool, args.concurrency, 0), (pool, args.concurrency, args.window)]
+
+    for pool, concurrency, window in profiles:
+        label = f"{pool} x{concurrency}, batch window {window * 1000:.0f}ms"
+        result = subprocess.run(
+            [sys.executable, __file__, "--faqs", str(args.faqs)]
+            + ["--run", pool, str(concurrency), str(window)],
+            capture_output=True,
+            text=True,
+        )
+        if result.returncode:
+            last_line = (result.stderr.strip().splitlines() or ["failed"])[-1]
+            print(f"{label:>34}: skipped ({last_line})")
+        else:
+            print(f"{label:>34}: {result.stdout.strip():>7} tasks/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -10,6 +10,7 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/5.1/ref/settings/
 """
 
+import os
 from pathlib import Path
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -44,6 +45,7 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
+    "faqs.compression.CompressionMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
@@ -120,6 +122,20 @@ USE_TZ = True
 
 STATIC_URL = "static/"
 
+# Offline FAQ snapshots (faqs.snapshots) are written to the "snapshots"
+# storage. Their names are content-hashed, so point it at a CDN-fronted bucket
+# in production and serve the files with a long, immutable Cache-Control.
+STORAGES = {
+    "default": {"BACKEND": "django.core.files.storage.FileSystemStorage"},
+    "staticfiles": {
+        "BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage",
+    },
+    "snapshots": {
+        "BACKEND": "django.core.files.storage.FileSystemStorage",
+        "OPTIONS": {"location": BASE_DIR / "snapshots", "base_url": "/snapshots/"},
+    },
+}
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.1/ref/settings/#default-auto-field
 
@@ -138,10 +154,43 @@ CACHES = {
     }
 }
 
+# Compression of API responses (faqs.compression.CompressionMiddleware).
+# FAQ detail bodies are cached already gzipped, so the Redis client does not
+# get a COMPRESSOR of its own.
+COMPRESSION_PATH_PREFIX = "/api/"
+COMPRESSION_MIN_SIZE = 1024  # bytes
+
 # settings.py
 POPULAR_INDIAN_LANGUAGES = ["hi", "bn", "te", "ta", "mr", "gu", "kn", "ml", "pa", "or"]
 
+# Number of FAQs translated per batch task (admin re-translate action) and
+# the most single-language requests a worker micro-batch collects
+TRANSLATION_BATCH_SIZE = 50
+# Seconds a worker waits for more single-language requests before flushing
+# them as one batch. googletrans sends one request per question, so batching
+# trades throughput for fewer upstream requests in flight and fewer DB writes;
+# 0 flushes every request on its own.
+TRANSLATION_BATCH_WINDOW = float(os.environ.get("TRANSLATION_BATCH_WINDOW", 0))
+
+# Seconds writes to a site are coalesced before its snapshots are rebuilt, and
+# the number of snapshot versions (and delta patches) kept per language
+FAQ_SNAPSHOT_DELAY = int(os.environ.get("FAQ_SNAPSHOT_DELAY", 30))
+FAQ_SNAPSHOT_KEEP = 10
+
+# FAQs whose detail payloads gunicorn caches at boot (faqs.warmup), 0 to skip
+FAQ_WARM_TOP_N = int(os.environ.get("FAQ_WARM_TOP_N", 0))
+
 # CELERY CONFIGURATION
 CELERY_BROKER_URL = "redis://127.0.0.1:6379/1"
 CELERY_ACCEPT_CONTENT = ["json"]
 CELERY_TASK_SERIALIZER = "json"
+
+# Translation worker profile. The tasks spend their time waiting on HTTP, so a
+# threads pool with high concurrency replaces prefork's one task per process;
+# a modest prefetch keeps threads fed without hoarding acks_late messages.
+# gevent/eventlet need monkey-patching, so pick those with `-P` instead.
+CELERY_WORKER_POOL = os.environ.get("CELERY_WORKER_POOL", "threads")
+CELERY_WORKER_CONCURRENCY = int(os.environ.get("CELERY_WORKER_CONCURRENCY", 32))
+CELERY_WORKER_PREFETCH_MULTIPLIER = int(
+    os.environ.get("CELERY_WORKER_PREFETCH_MULTIPLIER", 4)
+)
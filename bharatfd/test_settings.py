@@ -25,3 +25,6 @@ REST_FRAMEWORK = {
         "rest_framework.parsers.JSONParser",
     ],
 }
+
+# Flush translation micro-batches immediately
+TRANSLATION_BATCH_WINDOW = 0
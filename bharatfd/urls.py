@@ -1,3 +1,5 @@
+from django.conf import settings
+from django.conf.urls.static import static
 from django.contrib import admin
 from django.urls import include, path
 
@@ -5,3 +7,8 @@ urlpatterns = [
     path("admin/", admin.site.urls),  # Django admin
     path("api/", include("faqs.urls")),  # FAQ app's URLs
 ]
+
+# Production serves snapshots from the storage's own URL (bucket or CDN)
+snapshots = settings.STORAGES["snapshots"].get("OPTIONS", {})
+if "location" in snapshots:
+    urlpatterns += static(snapshots["base_url"], document_root=snapshots["location"])
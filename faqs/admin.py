@@ -1,13 +1,57 @@
+from html import unescape
+
 from ckeditor.widgets import CKEditorWidget
 from django import forms
+from django.conf import settings
 from django.contrib import admin
+from django.db import models
+from django.db.models import Count, Q
+from django.db.models.functions import Left
+from django.utils.html import strip_tags
+from django.utils.text import Truncator
 
 from .models import FAQ, FAQTranslation
+from .tasks import translate_faq_batch
+
+ANSWER_PREVIEW_LENGTH = 80
+# HTML prefix fetched from the DB for the preview; markup usually dominates
+ANSWER_PREFIX_LENGTH = 1000
+
+
+def _translated_alias(lang):
+    return f"translated_{lang}"
+
+
+def html_preview(html, length=ANSWER_PREVIEW_LENGTH):
+    """Plain-text preview of a (possibly truncated) HTML fragment."""
+    if "<" in html.rsplit(">", 1)[-1]:
+        html = html[: html.rfind("<")]  # Drop a tag cut off by the prefix
+    text = " ".join(unescape(strip_tags(html)).split())
+    return Truncator(text).chars(length)
 
 
 class FAQTranslationInline(admin.TabularInline):
     model = FAQTranslation
     extra = 1  # Number of empty translation slots
+    fields = ("language", "translated_text")
+    formfield_overrides = {
+        models.TextField: {"widget": forms.Textarea(attrs={"rows": 2, "cols": 60})},
+    }
+
+
+class SiteListFilter(admin.SimpleListFilter):
+    title = "site"
+    parameter_name = "site"
+
+    def lookups(self, request, model_admin):
+        # Its own query: the changelist queryset is annotated and grouped
+        sites = FAQ.objects.order_by("site").values_list("site", flat=True).distinct()
+        return [(site, site) for site in sites]
+
+    def queryset(self, request, queryset):
+        if self.value():
+            return queryset.filter(site=self.value())
+        return queryset
 
 
 class FAQAdminForm(forms.ModelForm):
@@ -22,4 +66,62 @@ class FAQAdminForm(forms.ModelForm):
 class FAQAdmin(admin.ModelAdmin):
     form = FAQAdminForm
     inlines = [FAQTranslationInline]
-    list_display = ("question", "answer")
+    list_display = ("question", "site", "answer_preview", "translation_status")
+    list_filter = (SiteListFilter,)
+    list_per_page = 50
+    show_full_result_count = False
+    search_fields = ("question", "answer_text", "translations__translated_text")
+    actions = ["retranslate"]
+
+    def get_queryset(self, request):
+        queryset = super().get_queryset(request)
+        opts = self.model._meta
+        changelist = f"{opts.app_label}_{opts.model_name}_changelist"
+        if getattr(request.resolver_match, "url_name", None) == changelist:
+            queryset = self.annotate_changelist(queryset)
+        return queryset
+
+    @staticmethod
+    def annotate_changelist(queryset):
+        # One grouped query: answer prefix plus a translated-row count per language.
+        # Only the displayed columns are loaded, never a full or rendered answer.
+        translated = ~Q(translations__translated_text="")
+        return queryset.only("id", "site", "question").annotate(
+            answer_prefix=Left("answer", ANSWER_PREFIX_LENGTH),
+            **{
+                _translated_alias(lang): Count(
+                    "translations",
+                    filter=Q(translations__language=lang) & translated,
+                    distinct=True,
+                )
+                for lang in settings.POPULAR_INDIAN_LANGUAGES
+            },
+        )
+
+    @admin.display(description="Answer")
+    def answer_preview(self, obj):
+        return html_preview(obj.answer_prefix)
+
+    @admin.display(description="Translations")
+    def translation_status(self, obj):
+        languages = settings.POPULAR_INDIAN_LANGUAGES
+        missing = [
+            lang for lang in languages if not getattr(obj, _translated_alias(lang))
+        ]
+        status = f"{len(languages) - len(missing)}/{len(languages)}"
+        return f"{status} (missing: {', '.join(missing)})" if missing else status
+
+    @admin.action(description="Re-translate selected FAQs")
+    def retranslate(self, request, queryset):
+        faq_ids = list(queryset.order_by("pk").values_list("pk", flat=True))
+        batch_size = settings.TRANSLATION_BATCH_SIZE
+        batches = 0
+        for start in range(0, len(faq_ids), batch_size):
+            batch = faq_ids[start : start + batch_size]
+            for lang in settings.POPULAR_INDIAN_LANGUAGES:
+                translate_faq_batch.delay_on_commit(batch, lang, force=True)
+            batches += 1
+        self.message_user(
+            request,
+            f"Queued re-translation of {len(faq_ids)} FAQ(s) in {batches} batch(es).",
+        )
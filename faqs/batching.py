@@ -0,0 +1,66 @@
+import threading
+from concurrent.futures import Future
+
+
+class _Batch:
+    def __init__(self):
+        self.items = []
+        self.futures = []
+        self.flushed = threading.Event()
+
+
+class MicroBatcher:
+    """
+    Collect items submitted from concurrent threads (e.g. a threads or gevent
+    Celery pool) and hand them to `flush_fn(key, items)` in one call per key.
+
+    The first submitter for a key waits up to `window` seconds for others to
+    join and then flushes; a batch that reaches `max_size` is flushed at once
+    by the submitter that filled it. `flush_fn` returns {item: exception} for
+    items that failed; everything else resolves to None.
+    """
+
+    def __init__(self, flush_fn, window, max_size):
+        self.flush_fn = flush_fn
+        self.window = window
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self._pending = {}
+
+    def submit(self, key, item):
+        future = Future()
+        with self._lock:
+            batch = self._pending.setdefault(key, _Batch())
+            batch.items.append(item)
+            batch.futures.append(future)
+            leader = len(batch.items) == 1
+            full = len(batch.items) >= self.max_size
+            if full:
+                del self._pending[key]
+
+        if full:
+            self._flush(key, batch)
+        elif leader:
+            batch.flushed.wait(self.window)
+            with self._lock:
+                flush = self._pending.get(key) is batch
+                if flush:
+                    del self._pending[key]
+            if flush:
+                self._flush(key, batch)
+        return future
+
+    def _flush(self, key, batch):
+        try:
+            errors = self.flush_fn(key, list(batch.items))
+        except Exception as e:
+            for future in batch.futures:
+                future.set_exception(e)
+        else:
+            for item, future in zip(batch.items, batch.futures):
+                if item in errors:
+                    future.set_exception(errors[item])
+                else:
+                    future.set_result(None)
+        finally:
+            batch.flushed.set()
@@ -0,0 +1,42 @@
+"""
+Versioned cache of FAQ API payloads. Every site has its own version, so a
+write to one site leaves the cached entries of the others valid.
+"""
+
+from django.core.cache import cache
+
+from .compression import compress_cache_body
+from .models import DEFAULT_SITE
+from .renderers import FastJSONRenderer
+
+CACHE_TIMEOUT = 60 * 15  # 15 minutes
+CACHE_VERSION_KEY = "faq_cache_version"
+
+
+def _cache_version_key(site):
+    if site == DEFAULT_SITE:
+        return CACHE_VERSION_KEY
+    return f"{CACHE_VERSION_KEY}:{site}"
+
+
+def get_cache_version(site=DEFAULT_SITE):
+    version = cache.get(_cache_version_key(site))
+    return version or 1
+
+
+def increment_cache_version(site=DEFAULT_SITE):
+    version = get_cache_version(site) + 1
+    cache.set(_cache_version_key(site), version)
+    return version
+
+
+def get_cache_key(resource_type, identifier, lang, site=DEFAULT_SITE):
+    version = get_cache_version(site)
+    return f"{site}:faq_{resource_type}_{identifier}_{lang}_v{version}"
+
+
+def cache_faq_detail(data, lang, site=DEFAULT_SITE, cache_key=None):
+    # Stored as gzipped compact JSON, see FAQViewSet._cached_response
+    body = FastJSONRenderer().render(data)
+    cache_key = cache_key or get_cache_key("detail", data["id"], lang, site)
+    cache.set(cache_key, compress_cache_body(body), CACHE_TIMEOUT)
@@ -0,0 +1,78 @@
+import gzip
+
+from django.conf import settings
+from django.middleware.gzip import GZipMiddleware
+from django.utils.cache import patch_vary_headers
+from django.utils.text import compress_string
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - brotli is optional
+    brotli = None
+
+BROTLI_QUALITY = 5
+
+
+def accepted_encodings(request):
+    """Content codings the client accepts, ignoring those sent with q=0."""
+    encodings = set()
+    for item in request.META.get("HTTP_ACCEPT_ENCODING", "").split(","):
+        coding, _, params = item.partition(";")
+        name, _, value = params.partition("=")
+        if name.strip().lower() == "q":
+            try:
+                if float(value) <= 0:
+                    continue
+            except ValueError:
+                continue
+        if coding.strip():
+            encodings.add(coding.strip().lower())
+    return encodings
+
+
+# Cached response bodies are stored gzipped so gzip clients can be served
+# the cached bytes without a decompress/recompress round trip.
+def compress_cache_body(body):
+    return compress_string(body)
+
+
+def decompress_cache_body(body):
+    return gzip.decompress(body)
+
+
+def cache_body_size(body):
+    """Uncompressed size of a cached body, read from its gzip trailer."""
+    return int.from_bytes(body[-4:], "little")
+
+
+class CompressionMiddleware(GZipMiddleware):
+    """
+    GZipMiddleware limited to API paths and bodies of at least
+    COMPRESSION_MIN_SIZE bytes, preferring brotli when it is installed and
+    accepted by the client.
+    """
+
+    def process_response(self, request, response):
+        if (
+            not request.path.startswith(settings.COMPRESSION_PATH_PREFIX)
+            or response.has_header("Content-Encoding")
+            or response.streaming
+            or len(response.content) < settings.COMPRESSION_MIN_SIZE
+        ):
+            return response
+
+        if brotli is None or "br" not in accepted_encodings(request):
+            return super().process_response(request, response)
+
+        patch_vary_headers(response, ("Accept-Encoding",))
+        compressed_content = brotli.compress(response.content, quality=BROTLI_QUALITY)
+        if len(compressed_content) >= len(response.content):
+            return response
+        response.content = compressed_content
+        response.headers["Content-Length"] = str(len(response.content))
+
+        etag = response.get("ETag")
+        if etag and etag.startswith('"'):
+            response.headers["ETag"] = "W/" + etag
+        response.headers["Content-Encoding"] = "br"
+        return response
@@ -0,0 +1,22 @@
+from django.core.management.base import BaseCommand
+
+from faqs.models import FAQ
+from faqs.snapshots import build_snapshot, snapshot_languages
+
+
+class Command(BaseCommand):
+    help = "Build the offline FAQ snapshots of every site and language now."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--site", action="append", help="Only this site.")
+        parser.add_argument("--lang", action="append", help="Only this language.")
+
+    def handle(self, *args, **options):
+        sites = options["site"] or FAQ.objects.values_list("site", flat=True).distinct()
+        languages = options["lang"] or snapshot_languages()
+        for site in sites:
+            for lang in languages:
+                snapshot = build_snapshot(site, lang)
+                self.stdout.write(
+                    f"{site}/{lang}: version {snapshot.version} ({snapshot.file})"
+                )
@@ -0,0 +1,38 @@
+from django.core.management.base import BaseCommand
+
+from faqs.models import FAQ
+
+
+class Command(BaseCommand):
+    help = "Backfill the sanitized answer HTML and plain text of existing FAQs."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--all",
+            action="store_true",
+            help="Re-render every FAQ, not only those never rendered.",
+        )
+        parser.add_argument("--batch-size", type=int, default=500)
+
+    def handle(self, *args, **options):
+        queryset = FAQ.objects.only("id", "answer").order_by("pk")
+        if not options["all"]:
+            queryset = queryset.filter(answer_html__isnull=True)
+
+        batch_size = options["batch_size"]
+        batch, rendered = [], 0
+        for faq in queryset.iterator(chunk_size=batch_size):
+            faq.render_answer()
+            batch.append(faq)
+            if len(batch) >= batch_size:
+                rendered += self._flush(batch)
+        rendered += self._flush(batch)
+
+        self.stdout.write(self.style.SUCCESS(f"Rendered {rendered} FAQ answer(s)."))
+
+    @staticmethod
+    def _flush(batch):
+        FAQ.objects.bulk_update(batch, ["answer_html", "answer_text"])
+        count = len(batch)
+        batch.clear()
+        return count
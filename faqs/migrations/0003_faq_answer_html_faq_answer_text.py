@@ -0,0 +1,22 @@
+# Generated by Django 5.1.5 on 2026-10-19 18:50
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("faqs", "0002_remove_faq_question_bn_remove_faq_question_hi_and_more"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="faq",
+            name="answer_html",
+            field=models.TextField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name="faq",
+            name="answer_text",
+            field=models.TextField(blank=True, editable=False, null=True),
+        ),
+    ]
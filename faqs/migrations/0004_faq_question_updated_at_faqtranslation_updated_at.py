@@ -0,0 +1,22 @@
+# Generated by Django 5.1.5 on 2026-10-19 19:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("faqs", "0003_faq_answer_html_faq_answer_text"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="faq",
+            name="question_updated_at",
+            field=models.DateTimeField(editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name="faqtranslation",
+            name="updated_at",
+            field=models.DateTimeField(auto_now=True, null=True),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.1.5 on 2026-10-19 19:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("faqs", "0004_faq_question_updated_at_faqtranslation_updated_at"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="faq",
+            name="site",
+            field=models.SlugField(db_index=False, default="default"),
+        ),
+        migrations.AddIndex(
+            model_name="faq",
+            index=models.Index(fields=["site", "id"], name="faq_site_id_idx"),
+        ),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 5.1.5 on 2026-10-19 19:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("faqs", "0005_faq_site"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="FAQSnapshot",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("site", models.SlugField()),
+                ("language", models.CharField(max_length=10)),
+                ("version", models.PositiveIntegerField()),
+                ("content_hash", models.CharField(max_length=64)),
+                ("file", models.CharField(max_length=255)),
+                ("delta_file", models.CharField(blank=True, max_length=255)),
+                ("size", models.PositiveIntegerField()),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                "unique_together": {("site", "language", "version")},
+            },
+        ),
+    ]
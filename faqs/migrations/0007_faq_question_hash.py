@@ -0,0 +1,36 @@
+# Generated by Django 5.1.5 on 2026-10-19 19:19
+
+import hashlib
+
+from django.db import migrations, models
+
+
+def backfill_question_hash(apps, schema_editor):
+    FAQ = apps.get_model("faqs", "FAQ")
+    batch = []
+    for faq in FAQ.objects.only("id", "question").iterator(chunk_size=500):
+        faq.question_hash = hashlib.sha1(
+            faq.question.encode(), usedforsecurity=False
+        ).hexdigest()
+        batch.append(faq)
+        if len(batch) >= 500:
+            FAQ.objects.bulk_update(batch, ["question_hash"])
+            batch.clear()
+    FAQ.objects.bulk_update(batch, ["question_hash"])
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("faqs", "0006_faqsnapshot"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="faq",
+            name="question_hash",
+            field=models.CharField(
+                blank=True, db_index=True, default="", editable=False, max_length=40
+            ),
+        ),
+        migrations.RunPython(backfill_question_hash, migrations.RunPython.noop),
+    ]
@@ -1,15 +1,74 @@
+import hashlib
 import logging
 
 from ckeditor.fields import RichTextField
 from django.db import models
-from googletrans import Translator
+from django.utils import timezone
+
+from .rendering import render_answer
+from .translation import get_googletrans_client
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_SITE = "default"
+
+
+def question_hash(question):
+    """Indexable key for exact question lookups (translation memory)."""
+    return hashlib.sha1(question.encode(), usedforsecurity=False).hexdigest()
+
 
 class FAQ(models.Model):
+    # Partition (product site or category); reads and caches are scoped to it
+    site = models.SlugField(max_length=50, default=DEFAULT_SITE, db_index=False)
     question = models.TextField()  # English (default)
+    question_hash = models.CharField(
+        max_length=40, blank=True, default="", db_index=True, editable=False
+    )
     answer = RichTextField()
+    # Rendered from `answer` on save; NULL until backfilled (render_faq_answers)
+    answer_html = models.TextField(null=True, blank=True, editable=False)
+    answer_text = models.TextField(null=True, blank=True, editable=False)
+    # Translations last updated before this are stale
+    question_updated_at = models.DateTimeField(null=True, editable=False)
+
+    class Meta:
+        indexes = [models.Index(fields=["site", "id"], name="faq_site_id_idx")]
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_question = instance.__dict__.get("question")
+        instance._loaded_site = instance.__dict__.get("site")
+        return instance
+
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get("update_fields")
+        derived = set()
+        if update_fields is None or "answer" in update_fields:
+            self.render_answer()
+            derived |= {"answer_html", "answer_text"}
+        if self._question_changed(update_fields):
+            self.question_updated_at = timezone.now()
+            self.question_hash = question_hash(self.question)
+            self._loaded_question = self.question
+            derived |= {"question_updated_at", "question_hash"}
+        if update_fields is not None:
+            kwargs["update_fields"] = {*update_fields, *derived}
+        super().save(*args, **kwargs)
+
+    def _question_changed(self, update_fields):
+        if update_fields is not None:
+            return "question" in update_fields
+        return getattr(self, "_loaded_question", None) != self.question
+
+    def render_answer(self):
+        self.answer_html, self.answer_text = render_answer(self.answer)
+
+    @property
+    def rendered_answer(self):
+        # Rows saved before answers were rendered at write time serve the raw HTML
+        return self.answer if self.answer_html is None else self.answer_html
 
     def get_translated_question(self, lang="en"):
         try:
@@ -22,7 +81,7 @@ class FAQ(models.Model):
         if created or not translation.translated_text:
             try:
                 # Attempt translation
-                translator = Translator()
+                translator = get_googletrans_client()
                 translated = translator.translate(self.question, dest=lang)
                 translation.translated_text = translated.text
                 translation.save()
@@ -39,6 +98,24 @@ class FAQTranslation(models.Model):
     faq = models.ForeignKey(FAQ, on_delete=models.CASCADE, related_name="translations")
     language = models.CharField(max_length=10)  # e.g., 'hi', 'bn', 'fr'
     translated_text = models.TextField(blank=True)
+    updated_at = models.DateTimeField(auto_now=True, null=True)
 
     class Meta:
         unique_together = ("faq", "language")  # Prevent duplicate translations
+
+
+class FAQSnapshot(models.Model):
+    """One immutable export of a site's FAQs in one language (faqs.snapshots)."""
+
+    site = models.SlugField(max_length=50)
+    language = models.CharField(max_length=10)
+    version = models.PositiveIntegerField()
+    content_hash = models.CharField(max_length=64)  # sha256 of the JSON body
+    # Names in the "snapshots" storage; the delta patches the previous version
+    file = models.CharField(max_length=255)
+    delta_file = models.CharField(max_length=255, blank=True)
+    size = models.PositiveIntegerField()  # compressed bytes
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        unique_together = ("site", "language", "version")
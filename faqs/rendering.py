@@ -0,0 +1,105 @@
+"""Write-time processing of CKEditor answer HTML."""
+
+import re
+from html.parser import HTMLParser
+
+import nh3
+
+ALLOWED_ATTRIBUTES = {**nh3.ALLOWED_ATTRIBUTES, "*": {"style", "title"}}
+# Inline styles CKEditor emits for alignment, colours and image sizing
+ALLOWED_STYLE_PROPERTIES = {
+    "background-color",
+    "color",
+    "float",
+    "font-size",
+    "font-style",
+    "font-weight",
+    "height",
+    "margin",
+    "margin-left",
+    "margin-right",
+    "text-align",
+    "text-decoration",
+    "width",
+}
+IMG_ATTRIBUTES = {"loading": "lazy", "decoding": "async"}
+
+# Tags whose boundaries separate words in the plain-text version
+BLOCK_TAGS = {
+    "blockquote",
+    "br",
+    "dd",
+    "div",
+    "dt",
+    "figcaption",
+    "h1",
+    "h2",
+    "h3",
+    "h4",
+    "h5",
+    "h6",
+    "hr",
+    "li",
+    "p",
+    "pre",
+    "td",
+    "th",
+    "tr",
+}
+
+_PRE_BLOCK = re.compile(r"(<pre\b.*?</pre>)", re.IGNORECASE | re.DOTALL)
+_WHITESPACE = re.compile(r"\s+")
+_BLOCK_TAG_SPACE = re.compile(
+    r"\s*(</?(?:%s)\b[^>]*>)\s*" % "|".join(sorted(BLOCK_TAGS | {"ol", "ul", "table"}))
+)
+
+
+def sanitize_html(html):
+    """Strip disallowed tags, attributes and styles; lazy-load images."""
+    return nh3.clean(
+        html,
+        attributes=ALLOWED_ATTRIBUTES,
+        filter_style_properties=ALLOWED_STYLE_PROPERTIES,
+        set_tag_attribute_values={"img": IMG_ATTRIBUTES},
+    )
+
+
+def minify_html(html):
+    """Collapse whitespace outside <pre> and drop it around block tags."""
+    parts = _PRE_BLOCK.split(html)
+    for i in range(0, len(parts), 2):
+        # Even parts sit between <pre> blocks, so their ends are block edges too
+        collapsed = _WHITESPACE.sub(" ", parts[i])
+        parts[i] = _BLOCK_TAG_SPACE.sub(r"\1", collapsed).strip()
+    return "".join(parts)
+
+
+class _TextExtractor(HTMLParser):
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.chunks = []
+
+    def handle_starttag(self, tag, attrs):
+        if tag in BLOCK_TAGS:
+            self.chunks.append(" ")
+
+    def handle_endtag(self, tag):
+        if tag in BLOCK_TAGS:
+            self.chunks.append(" ")
+
+    def handle_data(self, data):
+        self.chunks.append(data)
+
+
+def html_to_text(html):
+    """Plain text of `html` with block boundaries kept as single spaces."""
+    parser = _TextExtractor()
+    parser.feed(html)
+    parser.close()
+    return " ".join("".join(parser.chunks).split())
+
+
+def render_answer(html):
+    """Return the (sanitized minified HTML, plain text) pair for an answer."""
+    rendered = minify_html(sanitize_html(html or ""))
+    return rendered, html_to_text(rendered)
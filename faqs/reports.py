@@ -0,0 +1,77 @@
+from django.db.models import Count, F, Q
+
+from .models import DEFAULT_SITE, FAQ, FAQTranslation
+
+
+def get_translation_status(languages, site=DEFAULT_SITE, missing_limit=20):
+    """
+    Translation coverage of `languages` over the FAQs of `site`, from aggregate
+    queries only; unlike FAQ.get_translated_question this never creates rows or
+    translates.
+
+    A translation is stale when it was last updated before its FAQ's question.
+    `oldest_missing` lists up to `missing_limit` (FAQ, language) pairs without
+    a non-empty translation, oldest FAQs first.
+    """
+    empty = Q(translated_text="")
+    per_language = {
+        row["language"]: row
+        for row in FAQTranslation.objects.filter(faq__site=site, language__in=languages)
+        .values("language")
+        .annotate(
+            translated=Count("id", filter=~empty),
+            empty=Count("id", filter=empty),
+            stale=Count(
+                "id",
+                filter=~empty & Q(updated_at__lt=F("faq__question_updated_at")),
+            ),
+        )
+        .order_by()
+    }
+    total = FAQ.objects.filter(site=site).count()
+
+    coverage = []
+    for lang in languages:
+        row = per_language.get(lang, {})
+        translated = row.get("translated", 0)
+        coverage.append(
+            {
+                "language": lang,
+                "translated": translated,
+                "missing": total - translated,
+                "empty": row.get("empty", 0),
+                "stale": row.get("stale", 0),
+                "coverage": round(translated / total, 4) if total else 1.0,
+            }
+        )
+
+    return {
+        "total_faqs": total,
+        "languages": coverage,
+        "oldest_missing": _oldest_missing(languages, site, missing_limit),
+    }
+
+
+def _oldest_missing(languages, site, limit):
+    covered = Q(translations__language__in=languages) & ~Q(
+        translations__translated_text=""
+    )
+    faq_ids = list(
+        FAQ.objects.filter(site=site)
+        .annotate(covered=Count("translations", filter=covered))
+        .filter(covered__lt=len(languages))
+        .order_by("pk")
+        .values_list("pk", flat=True)[:limit]
+    )
+    translated = set(
+        FAQTranslation.objects.filter(faq_id__in=faq_ids, language__in=languages)
+        .exclude(translated_text="")
+        .values_list("faq_id", "language")
+    )
+    missing = [
+        {"faq_id": faq_id, "language": lang}
+        for faq_id in faq_ids
+        for lang in languages
+        if (faq_id, lang) not in translated
+    ]
+    return missing[:limit]
@@ -1,16 +1,23 @@
 import logging
 
+from django.db.models import TextField
+from django.db.models.functions import Coalesce
 from rest_framework import serializers
 
-from .models import FAQ
+from .models import FAQ, FAQTranslation
 
 logger = logging.getLogger(__name__)
 
+# Chunk size for `faq_id__in` lookups, kept under SQLite's variable limit
+TRANSLATION_LOOKUP_CHUNK = 500
+
 
 class FAQSerializer(serializers.ModelSerializer):
     class Meta:
         model = FAQ
-        fields = ["id", "question", "answer"]
+        fields = ["id", "site", "question", "answer"]
+        # The partition is addressed with ?site= on reads, not echoed back
+        extra_kwargs = {"site": {"write_only": True}}
 
     def to_representation(self, instance):
         data = super().to_representation(instance)
@@ -21,4 +28,87 @@ class FAQSerializer(serializers.ModelSerializer):
             # Log warning and return default
             logger.warning(f"Missing translation for lang {lang} on FAQ {instance.id}")
             data["question"] = instance.question
+        data["answer"] = instance.rendered_answer
         return data
+
+    def get_changed_fields(self):
+        """Validated fields whose value differs from the instance being updated."""
+        return [
+            field
+            for field, value in self.validated_data.items()
+            if getattr(self.instance, field) != value
+        ]
+
+    def update(self, instance, validated_data):
+        # Write only the changed columns (FAQ.save re-renders the answer if needed)
+        changed = self.get_changed_fields()
+        for field in changed:
+            setattr(instance, field, validated_data[field])
+        if changed:
+            instance.save(update_fields=changed)
+        return instance
+
+
+# Read-only fast path: builds the same dicts as FAQSerializer straight from
+# `.values()` rows, without instantiating models or serializer fields.
+def faq_read_values(queryset, *extra_fields):
+    """`.values()` rows for serialize_faq_rows, answer resolved in the DB."""
+    return queryset.values(
+        "id",
+        "question",
+        *extra_fields,
+        rendered_answer=Coalesce("answer_html", "answer", output_field=TextField()),
+    )
+
+
+def get_translation_map(faq_ids, lang):
+    """Return {faq_id: translated_text} for the non-empty translations in `lang`."""
+    translations = {}
+    for start in range(0, len(faq_ids), TRANSLATION_LOOKUP_CHUNK):
+        chunk = faq_ids[start : start + TRANSLATION_LOOKUP_CHUNK]
+        translations.update(
+            FAQTranslation.objects.filter(faq_id__in=chunk, language=lang)
+            .exclude(translated_text="")
+            .values_list("faq_id", "translated_text")
+        )
+    return translations
+
+
+def _translate_row(row, lang):
+    # Same lazy-translation fallback FAQSerializer gets from the model
+    faq = FAQ(id=row["id"], question=row["question"])
+    try:
+        return faq.get_translated_question(lang)
+    except AttributeError:
+        logger.warning(f"Missing translation for lang {lang} on FAQ {faq.id}")
+        return faq.question
+
+
+def faq_row_data(row, question):
+    return {"id": row["id"], "question": question, "answer": row["rendered_answer"]}
+
+
+def serialize_faq_write(faq, lang):
+    """
+    Response body of a create or update: the stored translation or the English
+    question. Writes never translate inline; the queued tasks do that.
+    """
+    question = faq.question
+    if lang != "en":
+        question = get_translation_map([faq.id], lang).get(faq.id, question)
+    return faq_row_data(
+        {"id": faq.id, "rendered_answer": faq.rendered_answer}, question
+    )
+
+
+def serialize_faq_rows(rows, lang):
+    """Serialize `faq_read_values` rows for `lang`."""
+    rows = list(rows)
+    translations = get_translation_map([row["id"] for row in rows], lang)
+    data = []
+    for row in rows:
+        question = translations.get(row["id"])
+        if question is None:
+            question = _translate_row(row, lang)
+        data.append(faq_row_data(row, question))
+    return data
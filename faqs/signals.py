@@ -0,0 +1,39 @@
+"""
+Snapshot rebuilds for every FAQ and translation write that goes through the
+ORM: the API, the admin change form and its inline, and lazily stored
+translations. Bulk writes (bulk_create/bulk_update) send no signals and
+schedule their rebuilds themselves.
+"""
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import FAQ, FAQTranslation
+from .snapshots import snapshot_languages
+from .tasks import schedule_snapshot_builds
+
+
+@receiver(post_save, sender=FAQ)
+@receiver(post_delete, sender=FAQ)
+def faq_changed(sender, instance, **kwargs):
+    # An FAQ moved to another site leaves the snapshots of both
+    loaded_site = getattr(instance, "_loaded_site", None) or instance.site
+    instance._loaded_site = instance.site
+    for site in {loaded_site, instance.site}:
+        schedule_snapshot_builds(site, snapshot_languages())
+
+
+@receiver(post_save, sender=FAQTranslation)
+@receiver(post_delete, sender=FAQTranslation)
+def translation_changed(sender, instance, signal, created=False, origin=None, **kwargs):
+    if isinstance(origin, FAQ):
+        return  # Cascade of an FAQ delete, faq_changed covers every language
+    if not instance.translated_text and (created or signal is post_delete):
+        return  # Snapshots skip empty rows, e.g. a lazy translation's placeholder
+    if FAQTranslation.faq.is_cached(instance):
+        site = instance.faq.site
+    else:
+        site = FAQ.objects.filter(pk=instance.faq_id).values_list("site", flat=True)
+        site = site.first()
+    if site is not None:
+        schedule_snapshot_builds(site, [instance.language])
@@ -0,0 +1,178 @@
+"""
+Offline snapshots: the FAQ list of one site in one language, exported as a
+gzipped, content-hashed JSON file that clients and edge caches can keep
+forever. Consecutive versions are linked by small delta patches.
+"""
+
+import hashlib
+import json
+import logging
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.core.files.storage import storages
+from django.utils.text import compress_string
+
+from .compression import decompress_cache_body
+from .models import FAQ, FAQSnapshot
+from .renderers import FastJSONRenderer
+from .serializers import faq_read_values, faq_row_data, get_translation_map
+
+MANIFEST_CACHE_TIMEOUT = 60 * 15  # 15 minutes
+
+logger = logging.getLogger(__name__)
+
+
+def snapshot_languages():
+    return ["en", *settings.POPULAR_INDIAN_LANGUAGES]
+
+
+def get_snapshot_storage():
+    return storages["snapshots"]
+
+
+def manifest_cache_key(site, lang):
+    return f"{site}:faq_snapshot_manifest_{lang}"
+
+
+def snapshot_data(site, lang):
+    """
+    The `GET /api/faqs/?site=&lang=` payload from stored translations only;
+    FAQs not translated yet carry the English question until their
+    translation lands and triggers a rebuild.
+    """
+    rows = list(faq_read_values(FAQ.objects.filter(site=site).order_by("pk")))
+    translations = {}
+    if lang != "en":
+        translations = get_translation_map([row["id"] for row in rows], lang)
+    return [
+        faq_row_data(row, translations.get(row["id"], row["question"])) for row in rows
+    ]
+
+
+def snapshot_delta(old, new):
+    """Patch turning `old` snapshot data into `new`: rows to upsert, ids to drop."""
+    old_rows = {row["id"]: row for row in old}
+    new_ids = {row["id"] for row in new}
+    return {
+        "upsert": [row for row in new if old_rows.get(row["id"]) != row],
+        "delete": [faq_id for faq_id in old_rows if faq_id not in new_ids],
+    }
+
+
+def apply_snapshot_delta(data, delta):
+    """Apply a `snapshot_delta` patch the way clients do, keeping id order."""
+    rows = {row["id"]: row for row in data}
+    for faq_id in delta["delete"]:
+        rows.pop(faq_id, None)
+    rows.update((row["id"], row) for row in delta["upsert"])
+    return [rows[faq_id] for faq_id in sorted(rows)]
+
+
+def _write(storage, name, body):
+    # Names are content-addressed, so an existing file already holds `body`
+    if not storage.exists(name):
+        storage.save(name, ContentFile(compress_string(body)))
+
+
+def _read(storage, name):
+    with storage.open(name) as f:
+        return json.loads(decompress_cache_body(f.read()))
+
+
+def build_snapshot(site, lang):
+    """
+    Export the current FAQs of `site` in `lang` and return the latest
+    FAQSnapshot. Nothing is written when the content has not changed.
+    """
+    data = snapshot_data(site, lang)
+    body = FastJSONRenderer().render(data)
+    content_hash = hashlib.sha256(body).hexdigest()
+
+    latest = (
+        FAQSnapshot.objects.filter(site=site, language=lang)
+        .order_by("-version")
+        .first()
+    )
+    if latest is not None and latest.content_hash == content_hash:
+        return latest
+
+    storage = get_snapshot_storage()
+    prefix = f"faqs/{site}/{lang}/"
+    name = f"{prefix}{content_hash[:16]}.json.gz"
+    _write(storage, name, body)
+
+    delta_name = ""
+    if latest is not None:
+        try:
+            previous = _read(storage, latest.file)
+        except OSError as e:
+            logger.warning(f"Snapshot {latest.file} unreadable, no delta: {str(e)}")
+        else:
+            delta_name = (
+                f"{prefix}{latest.content_hash[:16]}-{content_hash[:16]}.json.gz"
+            )
+            delta = {
+                "from": latest.content_hash,
+                "to": content_hash,
+                **snapshot_delta(previous, data),
+            }
+            _write(storage, delta_name, FastJSONRenderer().render(delta))
+
+    snapshot = FAQSnapshot.objects.create(
+        site=site,
+        language=lang,
+        version=latest.version + 1 if latest else 1,
+        content_hash=content_hash,
+        file=name,
+        delta_file=delta_name,
+        size=storage.size(name),
+    )
+    prune_snapshots(site, lang)
+    cache.delete(manifest_cache_key(site, lang))
+    return snapshot
+
+
+def prune_snapshots(site, lang, keep=None):
+    """Delete all but the `keep` newest versions of a snapshot and their files."""
+    keep = keep or settings.FAQ_SNAPSHOT_KEEP
+    snapshots = list(
+        FAQSnapshot.objects.filter(site=site, language=lang).order_by("-version")
+    )
+    # Content that came back shares its file with a kept version
+    in_use = {name for s in snapshots[:keep] for name in (s.file, s.delta_file)}
+    storage = get_snapshot_storage()
+    for snapshot in snapshots[keep:]:
+        for name in (snapshot.file, snapshot.delta_file):
+            if name and name not in in_use:
+                storage.delete(name)
+        snapshot.delete()
+
+
+def get_snapshot_versions(site, lang):
+    """Kept versions of a snapshot, newest first, cached until the next build."""
+    key = manifest_cache_key(site, lang)
+    if (versions := cache.get(key)) is None:
+        versions = list(
+            FAQSnapshot.objects.filter(site=site, language=lang)
+            .order_by("-version")
+            .values("version", "content_hash", "file", "delta_file", "size")
+        )
+        cache.set(key, versions, MANIFEST_CACHE_TIMEOUT)
+    return versions
+
+
+def delta_chain(versions, since):
+    """
+    Delta files leading from the version hashed `since` to the newest one,
+    oldest first, or None when `since` is unknown or a link is missing.
+    """
+    chain = []
+    for snapshot in versions:
+        if snapshot["content_hash"] == since:
+            return chain[::-1]
+        if not snapshot["delta_file"]:
+            return None
+        chain.append(snapshot["delta_file"])
+    return None
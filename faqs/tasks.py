@@ -1,29 +1,206 @@
 import logging
+import threading
 
 from celery import shared_task
+from django.conf import settings
+from django.core.cache import cache
 from django.core.exceptions import ObjectDoesNotExist
-from googletrans import Translator
+from django.db import transaction
 
-from .models import FAQ, FAQTranslation
+from .batching import MicroBatcher
+from .caching import get_cache_key
+from .models import FAQ, FAQTranslation, question_hash
+from .snapshots import build_snapshot
+from .translation import get_googletrans_client
 
 logger = logging.getLogger(__name__)
 
+_local = threading.local()
 
-@shared_task(autoretry_for=(Exception,), max_retries=3)
-def translate_faq_language(faq_id, target_lang):
-    try:
-        faq = FAQ.objects.get(id=faq_id)
-        translation, _ = FAQTranslation.objects.get_or_create(
-            faq=faq, language=target_lang
-        )
-        if not translation.translated_text:
-            translator = Translator()
+
+def get_translator():
+    """googletrans client of the calling worker thread, reused across tasks."""
+    if getattr(_local, "translator", None) is None:
+        _local.translator = get_googletrans_client()
+    return _local.translator
+
+
+def discard_translator():
+    """Drop the calling thread's client; the next get_translator() makes a new one."""
+    _local.translator = None
+
+
+def translate_faqs(faq_ids, target_lang, force=False):
+    """
+    Translate the questions of `faq_ids` into `target_lang` with one translator
+    client and one bulk upsert. Only FAQs without a translation are sent
+    unless `force` is set.
+
+    Returns (number translated, {faq_id: exception} for missing or failed FAQs).
+    """
+    existing = dict(
+        FAQTranslation.objects.filter(
+            faq_id__in=faq_ids, language=target_lang
+        ).values_list("faq_id", "translated_text")
+    )
+    faqs = FAQ.objects.filter(id__in=faq_ids).only("id", "site", "question").in_bulk()
+    errors = {
+        faq_id: FAQ.DoesNotExist(f"FAQ {faq_id} does not exist")
+        for faq_id in faq_ids
+        if faq_id not in faqs
+    }
+    pending = [faq for faq in faqs.values() if force or not existing.get(faq.id)]
+    if not pending:
+        return 0, errors
+
+    translator = get_translator()
+    translations = []
+    for faq in pending:
+        try:
             result = translator.translate(faq.question, dest=target_lang)
-            translation.translated_text = result.text
-            translation.save()
+        except Exception as e:
+            # The client's connection may be broken; go on with a new one
+            discard_translator()
+            translator = get_translator()
+            errors[faq.id] = e
+            continue
+        translations.append(
+            FAQTranslation(faq=faq, language=target_lang, translated_text=result.text)
+        )
+
+    FAQTranslation.objects.bulk_create(
+        translations,
+        update_conflicts=True,
+        unique_fields=["faq", "language"],
+        update_fields=["translated_text", "updated_at"],
+    )
+    # Only the cached details of these FAQs in this language are stale now
+    stale = {}
+    for translation in translations:
+        faq = translation.faq
+        key = get_cache_key("detail", faq.id, target_lang, faq.site)
+        stale.setdefault(faq.site, []).append(key)
+    for site, keys in stale.items():
+        cache.delete_many(keys)
+        schedule_snapshot_builds(site, [target_lang])
+    return len(translations), errors
+
+
+def reuse_translations(faq, languages):
+    """
+    Copy translations of other FAQs with the same question text onto `faq`,
+    replacing its own, and return the languages that were filled.
+    """
+    remembered = dict(
+        FAQTranslation.objects.filter(
+            # The indexed hash narrows the join; the text rules out collisions
+            faq__question_hash=question_hash(faq.question),
+            faq__question=faq.question,
+            language__in=languages,
+        )
+        .exclude(faq=faq)
+        .exclude(translated_text="")
+        .values_list("language", "translated_text")
+    )
+    FAQTranslation.objects.bulk_create(
+        [
+            FAQTranslation(faq=faq, language=lang, translated_text=text)
+            for lang, text in remembered.items()
+        ],
+        update_conflicts=True,
+        unique_fields=["faq", "language"],
+        update_fields=["translated_text", "updated_at"],
+    )
+    if remembered:
+        schedule_snapshot_builds(faq.site, remembered)
+    return set(remembered)
+
+
+def _snapshot_pending_key(site, lang):
+    return f"{site}:faq_snapshot_pending_{lang}"
+
+
+def schedule_snapshot_builds(site, languages):
+    """
+    Rebuild the snapshots of `site` in `languages` once the current transaction
+    commits. Writes within FAQ_SNAPSHOT_DELAY seconds share one build.
+    """
+
+    def schedule():
+        delay = settings.FAQ_SNAPSHOT_DELAY
+        for lang in languages:
+            key = _snapshot_pending_key(site, lang)
+            # The build clears the key before reading, so later writes requeue
+            if cache.add(key, True, delay + 60):
+                try:
+                    build_faq_snapshot.apply_async((site, lang), countdown=delay)
+                except Exception:
+                    cache.delete(key)  # Let the next write try again
+                    raise
+
+    # The write itself has committed; a broker error is only logged
+    transaction.on_commit(schedule, robust=True)
+
+
+def _flush_translations(key, faq_ids):
+    target_lang, force = key
+    _, errors = translate_faqs(faq_ids, target_lang, force=force)
+    return errors
+
+
+# Single-language requests arriving within TRANSLATION_BATCH_WINDOW seconds of
+# each other in the same worker process share one translate_faqs call.
+translation_batcher = MicroBatcher(
+    _flush_translations,
+    window=settings.TRANSLATION_BATCH_WINDOW,
+    max_size=settings.TRANSLATION_BATCH_SIZE,
+)
+
+
+# Translations are idempotent upserts, so a task redelivered after a worker
+# crash (acks_late) only redoes work that was not persisted.
+@shared_task(autoretry_for=(Exception,), max_retries=3, acks_late=True)
+def translate_faq_language(faq_id, target_lang, force=False):
+    try:
+        translation_batcher.submit((target_lang, force), faq_id).result()
     except ObjectDoesNotExist:
         logger.error(f"FAQ {faq_id} does not exist")
         raise
     except Exception as e:
         logger.error(f"Translation task failed: {str(e)}")
         raise
+
+
+@shared_task(bind=True, autoretry_for=(Exception,), max_retries=3, acks_late=True)
+def translate_faq_batch(self, faq_ids, target_lang, force=False):
+    """Translate a batch of FAQs with one translator client and one bulk write."""
+    try:
+        translated, errors = translate_faqs(faq_ids, target_lang, force=force)
+    except Exception as e:
+        logger.error(f"Batch translation task failed: {str(e)}")
+        raise
+
+    failed = {
+        faq_id: error
+        for faq_id, error in errors.items()
+        if not isinstance(error, ObjectDoesNotExist)
+    }
+    for faq_id, error in errors.items():
+        logger.error(f"Translating FAQ {faq_id} to {target_lang} failed: {error}")
+    if failed:
+        # Retry only the failed FAQs; a forced retry would redo the whole batch
+        raise self.retry(
+            args=(list(failed), target_lang, force), exc=next(iter(failed.values()))
+        )
+    return translated
+
+
+@shared_task(autoretry_for=(Exception,), max_retries=3, acks_late=True)
+def build_faq_snapshot(site, lang):
+    cache.delete(_snapshot_pending_key(site, lang))
+    try:
+        snapshot = build_snapshot(site, lang)
+    except Exception as e:
+        logger.error(f"Snapshot build failed for {site}/{lang}: {str(e)}")
+        raise
+    return snapshot.version
@@ -0,0 +1,113 @@
+from unittest.mock import patch
+
+import pytest
+from django.conf import settings
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from faqs.admin import html_preview
+from faqs.models import FAQ, FAQTranslation
+
+CHANGELIST_URL = reverse("admin:faqs_faq_changelist")
+
+
+@pytest.fixture
+def faq():
+    faq = FAQ.objects.create(
+        question="Help?", answer="<p>Step&nbsp;by <strong>step</strong>.</p>"
+    )
+    FAQTranslation.objects.create(faq=faq, language="hi", translated_text="मदद?")
+    FAQTranslation.objects.create(faq=faq, language="bn", translated_text="")
+    return faq
+
+
+def test_html_preview_strips_and_truncates():
+    assert html_preview("<p>Hello&nbsp;<b>world</b></p>") == "Hello world"
+    assert html_preview("<p>" + "word " * 50 + "</p>", length=10) == "word word…"
+
+
+def test_html_preview_drops_cut_off_tag():
+    assert html_preview('<p>Hello</p><img src="data:image/png;base') == "Hello"
+
+
+@pytest.mark.django_db
+class TestFAQAdmin:
+    def test_changelist_preview_and_translation_status(self, admin_client, faq):
+        response = admin_client.get(CHANGELIST_URL)
+        assert response.status_code == 200
+
+        (row,) = response.context["cl"].result_list
+        assert row.answer_prefix == faq.answer
+        content = response.content.decode()
+        assert "Step by step." in content
+        total = len(settings.POPULAR_INDIAN_LANGUAGES)
+        assert f"1/{total} (missing: bn," in content
+
+    def test_changelist_is_one_query_for_results(
+        self, admin_client, faq, django_assert_max_num_queries
+    ):
+        for i in range(5):
+            FAQ.objects.create(question=f"Q{i}?", answer="<p>A.</p>")
+        # Session, user, one grouped result query and the filtered count
+        with django_assert_max_num_queries(5):
+            admin_client.get(CHANGELIST_URL)
+
+    def test_changelist_never_loads_full_answers(self, admin_client, faq):
+        with CaptureQueriesContext(connection) as queries:
+            admin_client.get(CHANGELIST_URL)
+
+        (results,) = [
+            query["sql"] for query in queries if "translated_hi" in query["sql"]
+        ]
+        assert "answer_html" not in results
+        assert "answer_text" not in results
+        # The raw answer is only read through the prefix expression
+        assert results.count('"faqs_faq"."answer"') == results.count(
+            'SUBSTR("faqs_faq"."answer"'
+        )
+
+    def test_site_filter(self, admin_client, faq):
+        shop = FAQ.objects.create(site="shop", question="Shop?", answer="Yes.")
+        with CaptureQueriesContext(connection) as queries:
+            response = admin_client.get(CHANGELIST_URL, {"site": "shop"})
+
+        assert list(response.context["cl"].result_list) == [shop]
+        (choices,) = [
+            query["sql"]
+            for query in queries
+            if query["sql"].startswith("SELECT DISTINCT")
+        ]
+        # The choices come from a plain lookup, not the grouped changelist query
+        assert "JOIN" not in choices
+        assert "GROUP BY" not in choices
+
+    def test_search_translations(self, admin_client, faq):
+        FAQ.objects.create(question="Other?", answer="Other.")
+        response = admin_client.get(CHANGELIST_URL, {"q": "मदद"})
+        assert list(response.context["cl"].result_list) == [faq]
+
+    def test_retranslate_action_batches(self, admin_client, faq, settings):
+        settings.TRANSLATION_BATCH_SIZE = 2
+        others = [FAQ.objects.create(question=f"Q{i}?", answer="A.") for i in range(2)]
+        ids = sorted([faq.pk] + [other.pk for other in others])
+
+        with patch("faqs.admin.translate_faq_batch.delay_on_commit") as mock_delay:
+            response = admin_client.post(
+                CHANGELIST_URL,
+                {"action": "retranslate", "_selected_action": ids},
+                follow=True,
+            )
+
+        assert response.status_code == 200
+        languages = settings.POPULAR_INDIAN_LANGUAGES
+        assert mock_delay.call_count == 2 * len(languages)
+        mock_delay.assert_any_call(ids[:2], languages[0], force=True)
+        mock_delay.assert_any_call(ids[2:], languages[-1], force=True)
+
+    def test_delete_selected_with_annotations(self, admin_client, faq):
+        admin_client.post(
+            CHANGELIST_URL,
+            {"action": "delete_selected", "_selected_action": [faq.pk], "post": "yes"},
+        )
+        assert not FAQ.objects.exists()
@@ -0,0 +1,77 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from faqs.batching import MicroBatcher
+
+
+class RecordingFlush:
+    def __init__(self, errors=None):
+        self.calls = []
+        self.errors = errors or {}
+
+    def __call__(self, key, items):
+        self.calls.append((key, sorted(items)))
+        return {item: self.errors[item] for item in items if item in self.errors}
+
+
+def submit_all(batcher, submissions):
+    with ThreadPoolExecutor(max_workers=len(submissions)) as pool:
+        futures = [pool.submit(batcher.submit, key, item) for key, item in submissions]
+        return [future.result() for future in futures]
+
+
+def test_concurrent_submissions_share_a_flush():
+    flush = RecordingFlush()
+    batcher = MicroBatcher(flush, window=0.5, max_size=100)
+
+    results = submit_all(batcher, [("hi", i) for i in range(5)])
+
+    assert [result.result() for result in results] == [None] * 5
+    assert flush.calls == [("hi", [0, 1, 2, 3, 4])]
+
+
+def test_batches_are_per_key():
+    flush = RecordingFlush()
+    batcher = MicroBatcher(flush, window=0.2, max_size=100)
+
+    submit_all(batcher, [("hi", 1), ("bn", 1), ("hi", 2)])
+
+    assert sorted(flush.calls) == [("bn", [1]), ("hi", [1, 2])]
+
+
+def test_full_batch_flushes_without_waiting():
+    flush = RecordingFlush()
+    batcher = MicroBatcher(flush, window=60, max_size=2)
+    leader_done = threading.Event()
+
+    def leader():
+        batcher.submit("hi", 1).result()
+        leader_done.set()
+
+    thread = threading.Thread(target=leader)
+    thread.start()
+    while not batcher._pending:
+        time.sleep(0.001)
+    batcher.submit("hi", 2).result()
+
+    assert leader_done.wait(5)
+    thread.join()
+    assert flush.calls == [("hi", [1, 2])]
+
+
+def test_item_errors_and_flush_failures():
+    error = ValueError("bad item")
+    batcher = MicroBatcher(RecordingFlush({2: error}), window=0, max_size=10)
+    assert batcher.submit("hi", 1).result() is None
+    with pytest.raises(ValueError):
+        batcher.submit("hi", 2).result()
+
+    def failing_flush(key, items):
+        raise RuntimeError("translator down")
+
+    batcher = MicroBatcher(failing_flush, window=0, max_size=10)
+    with pytest.raises(RuntimeError):
+        batcher.submit("hi", 1).result()
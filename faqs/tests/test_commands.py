@@ -0,0 +1,31 @@
+import pytest
+from django.core.management import call_command
+
+from faqs.models import FAQ
+
+
+@pytest.mark.django_db
+def test_render_faq_answers_backfills_unrendered(capsys):
+    FAQ.objects.bulk_create(
+        FAQ(question=f"Q{i}?", answer=f"<p>Answer {i}</p>") for i in range(3)
+    )
+    rendered = FAQ.objects.create(question="Done?", answer="<p>Done</p>")
+    FAQ.objects.filter(pk=rendered.pk).update(answer_html="<p>Stale</p>")
+
+    call_command("render_faq_answers", batch_size=2)
+
+    assert "Rendered 3 FAQ answer(s)." in capsys.readouterr().out
+    assert not FAQ.objects.filter(answer_html__isnull=True).exists()
+    assert FAQ.objects.get(question="Q1?").answer_text == "Answer 1"
+    assert FAQ.objects.get(pk=rendered.pk).answer_html == "<p>Stale</p>"
+
+
+@pytest.mark.django_db
+def test_render_faq_answers_all():
+    faq = FAQ.objects.create(question="Done?", answer="<p>Done</p>")
+    FAQ.objects.filter(pk=faq.pk).update(answer_html="<p>Stale</p>")
+
+    call_command("render_faq_answers", all=True)
+
+    faq.refresh_from_db()
+    assert faq.answer_html == "<p>Done</p>"
@@ -0,0 +1,51 @@
+import gzip
+
+import pytest
+from django.http import HttpResponse
+from django.test import RequestFactory
+
+from faqs.compression import CompressionMiddleware, accepted_encodings
+
+BODY = b'{"answer":"' + b"<p>Step by step.</p>" * 200 + b'"}'
+
+
+@pytest.fixture
+def rf():
+    return RequestFactory()
+
+
+def run_middleware(request, body=BODY):
+    middleware = CompressionMiddleware(lambda request: HttpResponse(body))
+    return middleware(request)
+
+
+def test_accepted_encodings(rf):
+    request = rf.get("/", HTTP_ACCEPT_ENCODING="gzip;q=1.0, br;q=0, deflate")
+    assert accepted_encodings(request) == {"gzip", "deflate"}
+
+
+def test_gzips_large_api_responses(rf, settings):
+    settings.COMPRESSION_MIN_SIZE = 1024
+    response = run_middleware(rf.get("/api/faqs/", HTTP_ACCEPT_ENCODING="gzip"))
+    assert response["Content-Encoding"] == "gzip"
+    assert gzip.decompress(response.content) == BODY
+
+
+def test_skips_small_responses(rf, settings):
+    settings.COMPRESSION_MIN_SIZE = 1024
+    request = rf.get("/api/faqs/", HTTP_ACCEPT_ENCODING="gzip")
+    response = run_middleware(request, body=b'{"id":1}')
+    assert not response.has_header("Content-Encoding")
+
+
+def test_skips_non_api_paths(rf):
+    response = run_middleware(rf.get("/admin/", HTTP_ACCEPT_ENCODING="gzip"))
+    assert not response.has_header("Content-Encoding")
+
+
+def test_brotli_when_accepted(rf):
+    brotli = pytest.importorskip("brotli")
+    request = rf.get("/api/faqs/", HTTP_ACCEPT_ENCODING="gzip, br")
+    response = run_middleware(request)
+    assert response["Content-Encoding"] == "br"
+    assert brotli.decompress(response.content) == BODY
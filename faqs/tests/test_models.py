@@ -4,7 +4,7 @@ import pytest
 from django.db import IntegrityError
 from googletrans.models import Translated
 
-from faqs.models import FAQ, FAQTranslation
+from faqs.models import FAQ, FAQTranslation, question_hash
 
 
 @pytest.mark.django_db
@@ -57,3 +57,59 @@ def test_faq_translation_unique_constraint():
 
     with pytest.raises(IntegrityError):
         FAQTranslation.objects.create(faq=faq, language="es", translated_text="¿Hola?")
+
+
+@pytest.mark.django_db
+def test_save_renders_answer():
+    faq = FAQ.objects.create(
+        question="Help?", answer="<p>Step&nbsp;one</p>\n<script>x()</script>"
+    )
+    assert faq.answer_html == "<p>Step&nbsp;one</p>"
+    assert faq.answer_text == "Step one"
+    assert faq.rendered_answer == faq.answer_html
+
+
+@pytest.mark.django_db
+def test_save_update_fields_renders_answer():
+    faq = FAQ.objects.create(question="Help?", answer="<p>Old</p>")
+    faq.answer = "<p>New</p>"
+    faq.save(update_fields=["answer"])
+
+    faq.refresh_from_db()
+    assert faq.answer_html == "<p>New</p>"
+    assert faq.answer_text == "New"
+
+
+@pytest.mark.django_db
+def test_rendered_answer_falls_back_before_backfill():
+    FAQ.objects.bulk_create([FAQ(question="Help?", answer="<p>Raw</p>")])
+    faq = FAQ.objects.get()
+    assert faq.answer_html is None
+    assert faq.rendered_answer == "<p>Raw</p>"
+
+
+@pytest.mark.django_db
+def test_question_updated_at_tracks_question_changes():
+    faq = FAQ.objects.create(question="Help?", answer="Here.")
+    created_at = faq.question_updated_at
+    assert created_at is not None
+
+    faq = FAQ.objects.get(pk=faq.pk)
+    faq.answer = "Changed."
+    faq.save()
+    assert faq.question_updated_at == created_at
+
+    faq.question = "Help me?"
+    faq.save()
+    assert faq.question_updated_at > created_at
+
+
+@pytest.mark.django_db
+def test_question_hash_tracks_question():
+    faq = FAQ.objects.create(question="Help?", answer="Here.")
+    assert faq.question_hash == question_hash("Help?")
+
+    faq.question = "Help me?"
+    faq.save(update_fields=["question"])
+    faq.refresh_from_db()
+    assert faq.question_hash == question_hash("Help me?")
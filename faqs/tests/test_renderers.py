@@ -0,0 +1,37 @@
+from unittest.mock import patch
+
+import pytest
+from rest_framework.renderers import JSONRenderer
+
+from faqs.renderers import FastJSONRenderer
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        [{"id": 1, "question": "Help?", "answer": "<p>Here.</p>"}],
+        {"id": 2, "question": "मदद?", "answer": "line\u2028sep\u2029end"},
+        {1: "int key", "nested": {"list": [1, 2, None, True]}},
+        [],
+    ],
+)
+def test_fast_renderer_matches_json_renderer(data):
+    assert FastJSONRenderer().render(data) == JSONRenderer().render(data)
+
+
+def test_fast_renderer_indented_output_falls_back():
+    data = {"id": 1, "question": "Help?"}
+    media_type = "application/json; indent=4"
+    rendered = FastJSONRenderer().render(data, media_type)
+    assert rendered == JSONRenderer().render(data, media_type)
+    assert b"\n" in rendered
+
+
+def test_fast_renderer_without_orjson():
+    data = {"id": 1, "question": "Help?"}
+    with patch("faqs.renderers.orjson", None):
+        assert FastJSONRenderer().render(data) == JSONRenderer().render(data)
+
+
+def test_fast_renderer_none():
+    assert FastJSONRenderer().render(None) == b""
@@ -0,0 +1,31 @@
+from faqs.rendering import html_to_text, minify_html, render_answer, sanitize_html
+
+
+def test_sanitize_removes_scripts_and_handlers():
+    html = '<p onclick="x()">Hi<script>alert(1)</script></p>'
+    assert sanitize_html(html) == "<p>Hi</p>"
+
+
+def test_sanitize_filters_styles():
+    html = '<p style="text-align:center;position:fixed">Hi</p>'
+    assert sanitize_html(html) == '<p style="text-align:center">Hi</p>'
+
+
+def test_sanitize_lazy_loads_images():
+    rendered = sanitize_html('<img src="a.png" alt="A">')
+    assert 'loading="lazy"' in rendered
+    assert 'decoding="async"' in rendered
+
+
+def test_minify_keeps_pre_and_inline_spacing():
+    html = "<p>\n  Hello <b>bold</b>  world\n</p>\n<pre>  a\n  b</pre>"
+    assert minify_html(html) == "<p>Hello <b>bold</b> world</p><pre>  a\n  b</pre>"
+
+
+def test_html_to_text_separates_blocks():
+    html = "<p>Step&nbsp;one</p><ul><li>a &amp; b</li><li>c</li></ul>"
+    assert html_to_text(html) == "Step one a & b c"
+
+
+def test_render_answer_empty():
+    assert render_answer(None) == ("", "")
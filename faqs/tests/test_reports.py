@@ -0,0 +1,109 @@
+from datetime import timedelta
+from unittest.mock import patch
+
+import pytest
+from django.utils import timezone
+
+from faqs.models import FAQ, FAQTranslation
+from faqs.reports import get_translation_status
+
+LANGUAGES = ["hi", "bn", "ta"]
+
+
+@pytest.fixture
+def faqs():
+    first = FAQ.objects.create(question="First?", answer="One.")
+    second = FAQ.objects.create(question="Second?", answer="Two.")
+    FAQTranslation.objects.create(faq=first, language="hi", translated_text="पहला?")
+    FAQTranslation.objects.create(faq=first, language="bn", translated_text="")
+    FAQTranslation.objects.create(faq=second, language="hi", translated_text="दूसरा?")
+    FAQTranslation.objects.create(
+        faq=second, language="bn", translated_text="দ্বিতীয়?"
+    )
+    FAQTranslation.objects.create(
+        faq=second, language="ta", translated_text="இரண்டாவது?"
+    )
+    # The second question changed after all its translations were written
+    FAQ.objects.filter(pk=second.pk).update(
+        question_updated_at=timezone.now() + timedelta(minutes=1)
+    )
+    return first, second
+
+
+@pytest.mark.django_db
+def test_translation_status(faqs, django_assert_num_queries):
+    first, second = faqs
+
+    with patch.object(FAQ, "get_translated_question") as mock_translate:
+        # Grouped aggregate, FAQ count, oldest incomplete FAQs, their rows
+        with django_assert_num_queries(4):
+            status = get_translation_status(LANGUAGES)
+        mock_translate.assert_not_called()
+
+    assert status["total_faqs"] == 2
+    assert status["languages"] == [
+        {
+            "language": "hi",
+            "translated": 2,
+            "missing": 0,
+            "empty": 0,
+            "stale": 1,
+            "coverage": 1.0,
+        },
+        {
+            "language": "bn",
+            "translated": 1,
+            "missing": 1,
+            "empty": 1,
+            "stale": 1,
+            "coverage": 0.5,
+        },
+        {
+            "language": "ta",
+            "translated": 1,
+            "missing": 1,
+            "empty": 0,
+            "stale": 1,
+            "coverage": 0.5,
+        },
+    ]
+    assert status["oldest_missing"] == [
+        {"faq_id": first.pk, "language": "bn"},
+        {"faq_id": first.pk, "language": "ta"},
+    ]
+    assert FAQTranslation.objects.count() == 5
+
+
+@pytest.mark.django_db
+def test_translation_status_missing_limit(faqs):
+    FAQ.objects.create(question="Third?", answer="Three.")
+    status = get_translation_status(LANGUAGES, missing_limit=3)
+    assert len(status["oldest_missing"]) == 3
+
+
+@pytest.mark.django_db
+def test_translation_status_without_faqs():
+    status = get_translation_status(LANGUAGES)
+    assert status["total_faqs"] == 0
+    assert status["languages"][0]["coverage"] == 1.0
+    assert status["oldest_missing"] == []
+
+
+@pytest.mark.django_db
+def test_translation_status_is_site_scoped(faqs):
+    shop = FAQ.objects.create(site="shop", question="Shop?", answer="Yes.")
+    FAQTranslation.objects.create(faq=shop, language="hi", translated_text="दुकान?")
+
+    status = get_translation_status(LANGUAGES, "shop")
+
+    assert status["total_faqs"] == 1
+    assert status["languages"][0] == {
+        "language": "hi",
+        "translated": 1,
+        "missing": 0,
+        "empty": 0,
+        "stale": 0,
+        "coverage": 1.0,
+    }
+    assert {row["faq_id"] for row in status["oldest_missing"]} == {shop.pk}
+    assert get_translation_status(LANGUAGES)["total_faqs"] == 2
@@ -0,0 +1,284 @@
+import gzip
+import json
+from contextlib import contextmanager
+
+import pytest
+from django.core.cache import cache
+from django.core.management import call_command
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIRequestFactory
+
+from faqs.models import FAQ, FAQSnapshot, FAQTranslation
+from faqs.snapshots import (
+    apply_snapshot_delta,
+    build_snapshot,
+    get_snapshot_storage,
+    snapshot_data,
+    snapshot_languages,
+)
+from faqs.tasks import build_faq_snapshot, schedule_snapshot_builds
+from faqs.views import FAQViewSet
+
+
+@pytest.fixture
+def snapshot_storage(settings, tmp_path):
+    settings.STORAGES = {
+        **settings.STORAGES,
+        "snapshots": {
+            "BACKEND": "django.core.files.storage.FileSystemStorage",
+            "OPTIONS": {"location": tmp_path, "base_url": "/snapshots/"},
+        },
+    }
+    cache.clear()
+    return get_snapshot_storage()
+
+
+def read(storage, name):
+    with storage.open(name) as f:
+        return json.loads(gzip.decompress(f.read()))
+
+
+def manifest(params, **headers):
+    view = FAQViewSet.as_view({"get": "snapshot"})
+    return view(APIRequestFactory().get("/faqs/snapshot/", params, **headers))
+
+
+@pytest.mark.django_db
+class TestBuildSnapshot:
+    def test_build_uses_stored_translations(self, snapshot_storage):
+        faq = FAQ.objects.create(question="Help?", answer="<p>Here.</p>")
+        other = FAQ.objects.create(question="Other?", answer="<p>There.</p>")
+        FAQ.objects.create(site="shop", question="Shop?", answer="<p>Shop.</p>")
+        FAQTranslation.objects.create(faq=faq, language="hi", translated_text="मदद?")
+
+        snapshot = build_snapshot("default", "hi")
+
+        assert snapshot.version == 1
+        assert snapshot.file.startswith("faqs/default/hi/")
+        assert snapshot.file[16:32] == snapshot.content_hash[:16]
+        assert read(snapshot_storage, snapshot.file) == [
+            {"id": faq.pk, "question": "मदद?", "answer": "<p>Here.</p>"},
+            {"id": other.pk, "question": "Other?", "answer": "<p>There.</p>"},
+        ]
+
+    def test_unchanged_content_is_not_rebuilt(self, snapshot_storage):
+        FAQ.objects.create(question="Help?", answer="<p>Here.</p>")
+        first = build_snapshot("default", "en")
+
+        assert build_snapshot("default", "en") == first
+        assert FAQSnapshot.objects.count() == 1
+
+    def test_rebuild_writes_delta_from_previous(self, snapshot_storage):
+        kept = FAQ.objects.create(question="Help?", answer="<p>Here.</p>")
+        edited = FAQ.objects.create(question="Old?", answer="<p>Old.</p>")
+        dropped = FAQ.objects.create(question="Gone?", answer="<p>Gone.</p>").pk
+        first = build_snapshot("default", "en")
+        old = read(snapshot_storage, first.file)
+
+        edited.question = "New?"
+        edited.save()
+        FAQ.objects.filter(pk=dropped).delete()
+        added = FAQ.objects.create(question="Added?", answer="<p>Added.</p>")
+        second = build_snapshot("default", "en")
+
+        assert second.version == 2
+        delta = read(snapshot_storage, second.delta_file)
+        assert delta["from"] == first.content_hash
+        assert delta["to"] == second.content_hash
+        assert delta["delete"] == [dropped]
+        assert {row["id"] for row in delta["upsert"]} == {edited.pk, added.pk}
+        assert kept.pk not in {row["id"] for row in delta["upsert"]}
+        assert apply_snapshot_delta(old, delta) == snapshot_data("default", "en")
+
+    def test_prune_keeps_files_of_kept_versions(self, settings, snapshot_storage):
+        settings.FAQ_SNAPSHOT_KEEP = 2
+        faq = FAQ.objects.create(question="A?", answer="<p>A.</p>")
+        first = build_snapshot("default", "en")
+        for question in ("B?", "A?"):
+            faq.question = question
+            faq.save()
+            latest = build_snapshot("default", "en")
+
+        versions = FAQSnapshot.objects.order_by("version")
+        assert [s.version for s in versions] == [2, 3]
+        # Version 3 has the content of pruned version 1 and shares its file
+        assert latest.file == first.file
+        assert snapshot_storage.exists(first.file)
+
+    def test_task_builds_snapshot(self, snapshot_storage):
+        FAQ.objects.create(question="Help?", answer="<p>Here.</p>")
+
+        assert build_faq_snapshot("default", "en") == 1
+
+    def test_schedule_coalesces_builds(
+        self, snapshot_storage, mocker, django_capture_on_commit_callbacks
+    ):
+        apply_async = mocker.patch("faqs.tasks.build_faq_snapshot.apply_async")
+        with django_capture_on_commit_callbacks(execute=True):
+            schedule_snapshot_builds("default", ["en", "hi"])
+            schedule_snapshot_builds("default", ["hi"])
+
+        assert [call.args[0] for call in apply_async.call_args_list] == [
+            ("default", "en"),
+            ("default", "hi"),
+        ]
+
+    def test_command_builds_every_site(self, snapshot_storage):
+        FAQ.objects.create(question="Help?", answer="<p>Here.</p>")
+        FAQ.objects.create(site="shop", question="Shop?", answer="<p>Shop.</p>")
+
+        call_command("build_faq_snapshots", lang=["en"])
+
+        assert set(FAQSnapshot.objects.values_list("site", "language")) == {
+            ("default", "en"),
+            ("shop", "en"),
+        }
+
+
+@pytest.mark.django_db
+class TestSnapshotManifest:
+    def test_missing_snapshot(self, snapshot_storage):
+        assert manifest({"lang": "hi"}).status_code == status.HTTP_404_NOT_FOUND
+
+    def test_manifest_and_delta_chain(self, snapshot_storage):
+        faq = FAQ.objects.create(question="A?", answer="<p>A.</p>")
+        first = build_snapshot("default", "en")
+        faq.question = "B?"
+        faq.save()
+        second = build_snapshot("default", "en")
+        faq.question = "C?"
+        faq.save()
+        third = build_snapshot("default", "en")
+
+        response = manifest({"since": first.content_hash})
+        assert response.status_code == status.HTTP_200_OK
+        assert response["ETag"] == f'"{third.content_hash}"'
+        assert response.data["version"] == 3
+        assert response.data["hash"] == third.content_hash
+        assert response.data["url"].endswith(f"/snapshots/{third.file}")
+        assert [url.rsplit("/snapshots/", 1)[1] for url in response.data["deltas"]] == [
+            second.delta_file,
+            third.delta_file,
+        ]
+        assert manifest({"since": third.content_hash}).data["deltas"] == []
+        assert manifest({"since": "unknown"}).data["deltas"] is None
+        assert "deltas" not in manifest({}).data
+
+    def test_manifest_not_modified(self, snapshot_storage):
+        FAQ.objects.create(question="A?", answer="<p>A.</p>")
+        snapshot = build_snapshot("default", "en")
+
+        response = manifest({}, HTTP_IF_NONE_MATCH=f'"{snapshot.content_hash}"')
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+
+@pytest.fixture
+def scheduled(snapshot_storage, mocker, django_capture_on_commit_callbacks):
+    """Snapshot builds queued by the writes in the block, as (site, lang)."""
+    apply_async = mocker.patch("faqs.tasks.build_faq_snapshot.apply_async")
+    builds = set()
+
+    @contextmanager
+    def capture():
+        with django_capture_on_commit_callbacks(execute=True):
+            yield builds
+        builds.update(call.args[0] for call in apply_async.call_args_list)
+
+    return capture
+
+
+@pytest.mark.django_db
+class TestSnapshotRebuildSignals:
+    def test_api_create_schedules_rebuild(self, scheduled, mocker):
+        mocker.patch("faqs.views.translate_faq_language.delay_on_commit")
+        view = FAQViewSet.as_view({"post": "create"})
+        request = APIRequestFactory().post(
+            "/faqs/?site=shop", {"question": "Q?", "answer": "A."}, format="json"
+        )
+
+        with scheduled() as builds:
+            assert view(request).status_code == status.HTTP_201_CREATED
+        assert builds == {("shop", lang) for lang in snapshot_languages()}
+
+    def test_admin_edit_schedules_rebuild(self, scheduled, admin_client):
+        faq = FAQ.objects.create(site="shop", question="Help?", answer="Here.")
+        hi = FAQTranslation.objects.create(faq=faq, language="hi", translated_text="x")
+        cache.clear()
+
+        with scheduled() as builds:
+            response = admin_client.post(
+                reverse("admin:faqs_faq_change", args=[faq.pk]),
+                {
+                    "question": "Help?",
+                    "answer": "Here.",
+                    "site": "docs",
+                    "translations-TOTAL_FORMS": "1",
+                    "translations-INITIAL_FORMS": "1",
+                    "translations-MIN_NUM_FORMS": "0",
+                    "translations-MAX_NUM_FORMS": "1000",
+                    "translations-0-id": hi.pk,
+                    "translations-0-faq": faq.pk,
+                    "translations-0-language": "hi",
+                    "translations-0-translated_text": "मदद?",
+                },
+            )
+
+        assert response.status_code == 302
+        # Moving the FAQ rebuilds both sites
+        assert builds == {
+            (site, lang) for site in ("shop", "docs") for lang in snapshot_languages()
+        }
+
+    def test_translation_write_schedules_its_language(self, scheduled):
+        faq = FAQ.objects.create(site="shop", question="Help?", answer="Here.")
+        cache.clear()
+
+        with scheduled() as builds:
+            FAQTranslation.objects.create(faq=faq, language="hi", translated_text="x")
+        assert builds == {("shop", "hi")}
+
+    def test_lazy_translation_schedules_its_language(self, scheduled, mocker):
+        faq = FAQ.objects.create(site="shop", question="Help?", answer="Here.")
+        client = mocker.patch("faqs.models.get_googletrans_client").return_value
+        client.translate.return_value.text = "मदद?"
+        cache.clear()
+
+        with scheduled() as builds:
+            assert FAQ.objects.get(pk=faq.pk).get_translated_question("hi") == "मदद?"
+        assert builds == {("shop", "hi")}
+
+    def test_failed_lazy_translation_schedules_nothing(self, scheduled, mocker):
+        faq = FAQ.objects.create(site="shop", question="Help?", answer="Here.")
+        client = mocker.patch("faqs.models.get_googletrans_client").return_value
+        client.translate.side_effect = Exception("API error")
+        cache.clear()
+
+        # The empty placeholder row is created and deleted again
+        with scheduled() as builds:
+            assert FAQ.objects.get(pk=faq.pk).get_translated_question("hi") == "Help?"
+        assert builds == set()
+
+    def test_delete_schedules_rebuild(self, scheduled):
+        faq = FAQ.objects.create(site="shop", question="Help?", answer="Here.")
+        FAQTranslation.objects.create(faq=faq, language="hi", translated_text="x")
+        cache.clear()
+
+        with scheduled() as builds:
+            FAQ.objects.get(pk=faq.pk).delete()
+        assert builds == {("shop", lang) for lang in snapshot_languages()}
+
+    def test_broker_error_does_not_fail_the_write(
+        self, snapshot_storage, mocker, django_capture_on_commit_callbacks
+    ):
+        apply_async = mocker.patch("faqs.tasks.build_faq_snapshot.apply_async")
+        apply_async.side_effect = OSError("broker down")
+
+        with django_capture_on_commit_callbacks(execute=True):
+            FAQ.objects.create(site="shop", question="Help?", answer="Here.")
+
+        # The pending marker is released so the next write requeues the build
+        apply_async.side_effect = None
+        with django_capture_on_commit_callbacks(execute=True):
+            schedule_snapshot_builds("shop", ["en"])
+        apply_async.assert_called_with(("shop", "en"), countdown=mocker.ANY)
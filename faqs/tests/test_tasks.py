@@ -3,14 +3,29 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 from celery.exceptions import Retry
+from django.core.cache import cache
 from django.core.exceptions import ObjectDoesNotExist
 
+from faqs.caching import get_cache_key, get_cache_version
 from faqs.models import FAQ, FAQTranslation
-from faqs.tasks import translate_faq_language
+from faqs.tasks import (
+    discard_translator,
+    get_translator,
+    translate_faq_batch,
+    translate_faq_language,
+)
 
 logger = logging.getLogger(__name__)
 
 
+@pytest.fixture(autouse=True)
+def fresh_translator():
+    # Tests patch the client factory; don't hand them an earlier test's client
+    discard_translator()
+    yield
+    discard_translator()
+
+
 @pytest.fixture
 def faq():
     return FAQ.objects.create(
@@ -28,8 +43,8 @@ def existing_translation(faq):
 @pytest.mark.django_db
 class TestTranslateFaqLanguage:
     def test_successful_translation(self, faq, mocker):
-        # Patch the Translator imported in tasks.py
-        mock_translator = mocker.patch("faqs.tasks.Translator")
+        # Patch the translator client factory imported in tasks.py
+        mock_translator = mocker.patch("faqs.tasks.get_googletrans_client")
         mock_translator.return_value.translate.return_value = MagicMock(
             text="Quelle est votre politique de retour?"
         )
@@ -45,8 +60,8 @@ class TestTranslateFaqLanguage:
         )
 
     def test_existing_translation(self, existing_translation, mocker):
-        # Patch the Translator imported in tasks.py
-        mock_translator = mocker.patch("faqs.tasks.Translator")
+        # Patch the translator client factory imported in tasks.py
+        mock_translator = mocker.patch("faqs.tasks.get_googletrans_client")
 
         # Execute
         translate_faq_language(existing_translation.faq.id, "es")
@@ -54,6 +69,15 @@ class TestTranslateFaqLanguage:
         # Verify
         mock_translator.return_value.translate.assert_not_called()
 
+    def test_forced_translation_replaces_existing(self, existing_translation, mocker):
+        mock_translator = mocker.patch("faqs.tasks.get_googletrans_client")
+        mock_translator.return_value.translate.return_value = MagicMock(text="Nuevo")
+
+        translate_faq_language(existing_translation.faq.id, "es", force=True)
+
+        existing_translation.refresh_from_db()
+        assert existing_translation.translated_text == "Nuevo"
+
     def test_nonexistent_faq(self, caplog):
         # Execute
         with pytest.raises(ObjectDoesNotExist):
@@ -66,8 +90,10 @@ class TestTranslateFaqLanguage:
         # Setup
         mock_retry = mocker.patch.object(translate_faq_language, "retry")
         mock_retry.side_effect = Retry()
-        # Patch the Translator imported in tasks.py
-        mocker.patch("faqs.tasks.Translator").side_effect = Exception("API Error")
+        # Patch the translator client factory imported in tasks.py
+        mocker.patch("faqs.tasks.get_googletrans_client").side_effect = Exception(
+            "API Error"
+        )
 
         # Execute & Verify
         with pytest.raises(Retry):
@@ -76,8 +102,8 @@ class TestTranslateFaqLanguage:
         assert mock_retry.call_count == 1
 
     def test_general_exception_handling(self, faq, mocker, caplog):
-        # Patch the Translator imported in tasks.py
-        mocker.patch("faqs.tasks.Translator").side_effect = Exception(
+        # Patch the translator client factory imported in tasks.py
+        mocker.patch("faqs.tasks.get_googletrans_client").side_effect = Exception(
             "Unexpected error"
         )
 
@@ -89,9 +115,128 @@ class TestTranslateFaqLanguage:
         assert "Translation task failed" in caplog.text
         assert "Unexpected error" in caplog.text
 
+    def test_batch_translation(self, faq, existing_translation, mocker):
+        other = FAQ.objects.create(question="Do you ship?", answer="Yes.")
+        mock_translator = mocker.patch("faqs.tasks.get_googletrans_client")
+        mock_translator.return_value.translate.side_effect = lambda text, dest: (
+            MagicMock(text=f"{dest}:{text}")
+        )
+
+        # Only the FAQ without a Spanish translation is translated
+        assert translate_faq_batch([faq.id, other.id], "es") == 1
+        assert mock_translator.call_count == 1
+        assert (
+            FAQTranslation.objects.get(faq=other, language="es").translated_text
+            == "es:Do you ship?"
+        )
+
+        # Forcing re-translates and overwrites the existing row
+        assert translate_faq_batch([faq.id, other.id], "es", force=True) == 2
+        existing_translation.refresh_from_db()
+        assert existing_translation.translated_text == "es:What is your return policy?"
+        assert FAQTranslation.objects.filter(language="es").count() == 2
+
+    def test_batch_translation_failure(self, faq, mocker, caplog):
+        mocker.patch("faqs.tasks.get_googletrans_client").side_effect = Exception(
+            "API Error"
+        )
+
+        with pytest.raises(Exception):
+            translate_faq_batch([faq.id], "fr")
+
+        assert "Batch translation task failed" in caplog.text
+        assert not FAQTranslation.objects.filter(language="fr").exists()
+
+    def test_batch_translation_partial_failure(self, faq, mocker, caplog):
+        other = FAQ.objects.create(question="Do you ship?", answer="Yes.")
+
+        def translate(text, dest):
+            if text == "Do you ship?":
+                raise Exception("Rate limited")
+            return MagicMock(text=f"{dest}:{text}")
+
+        mocker.patch(
+            "faqs.tasks.get_googletrans_client"
+        ).return_value.translate.side_effect = translate
+
+        # The successful translation is kept and the batch raises to retry
+        with pytest.raises(Exception, match="Rate limited"):
+            translate_faq_batch([faq.id, other.id, 9999], "fr")
+
+        assert FAQTranslation.objects.get(faq=faq, language="fr").translated_text
+        assert not FAQTranslation.objects.filter(faq=other, language="fr").exists()
+        assert "FAQ 9999 does not exist" in caplog.text
+        assert f"Translating FAQ {other.id} to fr failed" in caplog.text
+
+    def test_batch_retry_resends_only_failed(self, faq, mocker):
+        other = FAQ.objects.create(question="Do you ship?", answer="Yes.")
+
+        def translate(text, dest):
+            if text == "Do you ship?":
+                raise Exception("Rate limited")
+            return MagicMock(text=f"{dest}:{text}")
+
+        mock_translator = mocker.patch("faqs.tasks.get_googletrans_client")
+        mock_translator.return_value.translate.side_effect = translate
+        retry = mocker.patch.object(translate_faq_batch, "retry", side_effect=Retry)
+        version = get_cache_version()
+        cache.set(get_cache_key("detail", faq.id, "fr"), b"stale")
+        cache.set(get_cache_key("detail", other.id, "fr"), b"kept")
+
+        with pytest.raises(Retry):
+            translate_faq_batch([faq.id, other.id], "fr", force=True)
+
+        assert retry.call_args.kwargs["args"] == ([other.id], "fr", True)
+        # The forced overwrite that did succeed invalidates its cached payload
+        assert cache.get(get_cache_key("detail", faq.id, "fr")) is None
+        assert cache.get(get_cache_key("detail", other.id, "fr")) == b"kept"
+        assert get_cache_version() == version
+
+    def test_stored_translations_invalidate_their_details(self, faq, mocker):
+        shop = FAQ.objects.create(site="shop", question="Shipping?", answer="Yes.")
+        mock_translator = mocker.patch("faqs.tasks.get_googletrans_client")
+        mock_translator.return_value.translate.return_value = MagicMock(text="Envío?")
+        versions = get_cache_version(), get_cache_version("shop")
+        stale = get_cache_key("detail", shop.id, "es", "shop")
+        others = [
+            get_cache_key("detail", shop.id, "hi", "shop"),
+            get_cache_key("detail", faq.id, "es"),
+        ]
+        cache.set_many({key: b"cached" for key in [stale, *others]})
+
+        assert translate_faq_batch([shop.id], "es") == 1
+        assert cache.get(stale) is None
+        assert cache.get_many(others) == {key: b"cached" for key in others}
+        assert (get_cache_version(), get_cache_version("shop")) == versions
+
+        # Nothing translated, nothing invalidated
+        cache.set(stale, b"cached")
+        assert translate_faq_batch([shop.id], "es") == 0
+        assert cache.get(stale) == b"cached"
+
+    def test_translator_reused_per_thread(self, mocker):
+        mock_translator = mocker.patch("faqs.tasks.get_googletrans_client")
+
+        assert get_translator() is get_translator()
+        assert mock_translator.call_count == 1
+
+    def test_translator_discarded_after_error(self, faq, mocker):
+        other = FAQ.objects.create(question="Do you ship?", answer="Yes.")
+        mock_translator = mocker.patch("faqs.tasks.get_googletrans_client")
+        mock_translator.return_value.translate.side_effect = [
+            Exception("Connection reset"),
+            MagicMock(text="¿Envían?"),
+        ]
+
+        with pytest.raises(Exception, match="Connection reset"):
+            translate_faq_batch([faq.id, other.id], "es")
+
+        # The failed client is not reused for the rest of the batch
+        assert mock_translator.call_count == 2
+
     # def test_translation_flow_with_retries(self, faq, mocker):
-    #     # Patch the Translator imported in tasks.py
-    #     mock_translator = mocker.patch('faqs.tasks.Translator')
+    #     # Patch the translator client factory imported in tasks.py
+    #     mock_translator = mocker.patch('faqs.tasks.get_googletrans_client')
     #     mock_translator.return_value.translate.side_effect = [
     #         Exception("Temporary error"),
     #         MagicMock(text="Qual é a sua política de retorno?")
@@ -1,17 +1,19 @@
+import json
 from unittest.mock import patch
 
 import pytest
+from django.conf import settings
 from django.core.cache import cache
 from rest_framework import status
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
 from rest_framework.test import APIRequestFactory
 
+from faqs.caching import get_cache_key, get_cache_version, increment_cache_version
+from faqs.compression import decompress_cache_body
 from faqs.models import FAQ, FAQTranslation
-from faqs.views import (
-    FAQViewSet,
-    get_cache_key,
-    get_cache_version,
-    increment_cache_version,
-)
+from faqs.serializers import FAQSerializer
+from faqs.views import FAQViewSet
 
 
 @pytest.fixture
@@ -24,6 +26,16 @@ def faq():
     return FAQ.objects.create(question="Test?", answer="Answer.")
 
 
+@pytest.fixture
+def write_probe(mocker):
+    """Record cache calls, enqueued and inline translations of a write request."""
+    return {
+        "cache": mocker.patch("faqs.caching.cache", wraps=cache),
+        "delay": mocker.patch("faqs.views.translate_faq_language.delay_on_commit"),
+        "translator": mocker.patch("faqs.models.get_googletrans_client"),
+    }
+
+
 @pytest.mark.django_db
 class TestFAQViewSet:
     def test_retrieve_view_cache(self, api_rf, faq):
@@ -37,7 +49,7 @@ class TestFAQViewSet:
         # Get the actual cache key used
         cache_key = get_cache_key("detail", faq.pk, "en")
         cached_data = cache.get(cache_key)
-        assert cached_data == response.data
+        assert json.loads(decompress_cache_body(cached_data)) == response.data
 
         # Second request with controlled cache mock
         original_cache_get = cache.get  # Preserve original cache.get
@@ -70,6 +82,44 @@ class TestFAQViewSet:
         assert response.status_code == status.HTTP_201_CREATED
         assert get_cache_version() == initial_version + 1
 
+    def test_retrieve_serves_cached_gzip_body(self, api_rf, faq, settings):
+        settings.COMPRESSION_MIN_SIZE = 16
+        view = FAQViewSet.as_view({"get": "retrieve"})
+        request = api_rf.get(f"/faqs/{faq.pk}/", HTTP_ACCEPT_ENCODING="gzip, br")
+        first = view(request, pk=faq.pk)
+        first.render()
+
+        cached = view(request, pk=faq.pk)
+        assert cached["Content-Encoding"] == "gzip"
+        assert "Accept-Encoding" in cached["Vary"]
+        assert cached.content == cache.get(get_cache_key("detail", faq.pk, "en"))
+        assert decompress_cache_body(cached.content) == first.content
+
+    def test_retrieve_cached_small_body_uncompressed(self, api_rf, faq, settings):
+        settings.COMPRESSION_MIN_SIZE = 1024
+        view = FAQViewSet.as_view({"get": "retrieve"})
+        request = api_rf.get(f"/faqs/{faq.pk}/", HTTP_ACCEPT_ENCODING="gzip")
+        first = view(request, pk=faq.pk)
+        first.render()
+        assert len(first.content) < settings.COMPRESSION_MIN_SIZE
+
+        # A hit sends the same headers as the miss did
+        cached = view(request, pk=faq.pk)
+        cached.render()
+        assert not cached.has_header("Content-Encoding")
+        assert "Accept-Encoding" not in cached["Vary"]
+        assert cached["Vary"] == first["Vary"]
+        assert cached.content == first.content
+
+    def test_retrieve_cached_without_gzip(self, api_rf, faq):
+        view = FAQViewSet.as_view({"get": "retrieve"})
+        request = api_rf.get(f"/faqs/{faq.pk}/", HTTP_ACCEPT_ENCODING="identity")
+        first = view(request, pk=faq.pk)
+
+        cached = view(request, pk=faq.pk)
+        assert not cached.has_header("Content-Encoding")
+        assert cached.data == first.data
+
     def test_retrieve_view_translation(self, api_rf, faq):
         view = FAQViewSet.as_view({"get": "retrieve"})
         request = api_rf.get(f"/faqs/{faq.pk}/", {"lang": "hi"})
@@ -107,6 +157,18 @@ class TestFAQViewSet:
         assert response.status_code == status.HTTP_204_NO_CONTENT
         assert get_cache_version() == initial_version + 1
 
+    def test_delete_query_count(self, api_rf, faq, django_assert_num_queries):
+        for lang in [*settings.POPULAR_INDIAN_LANGUAGES, "fr"]:
+            FAQTranslation.objects.create(faq=faq, language=lang, translated_text="x")
+        view = FAQViewSet.as_view({"delete": "destroy"})
+        request = api_rf.delete(f"/faqs/{faq.pk}/")
+
+        # SELECT, SELECT and DELETE of the cascaded translations, DELETE; no
+        # per-translation site lookup for their snapshots
+        with django_assert_num_queries(4):
+            response = view(request, pk=faq.pk)
+        assert response.status_code == status.HTTP_204_NO_CONTENT
+
     def test_translation_fallback_mechanism(self, api_rf, faq):
         # Create empty translation
         FAQTranslation.objects.create(faq=faq, language="hi", translated_text="")
@@ -114,7 +176,7 @@ class TestFAQViewSet:
         view = FAQViewSet.as_view({"get": "retrieve"})
         request = api_rf.get(f"/faqs/{faq.pk}/", {"lang": "hi"})
 
-        with patch("faqs.models.Translator") as mock_translator:
+        with patch("faqs.models.get_googletrans_client") as mock_translator:
             mock_translator.return_value.translate.side_effect = Exception("API error")
             response = view(request, pk=faq.pk)
 
@@ -128,3 +190,262 @@ class TestFAQViewSet:
         version2 = get_cache_version()
         assert version2 == version1 + 1
         assert cache.get("faq_cache_version") == version2
+
+    def test_list_matches_model_serializer_output(self, api_rf, faq):
+        other = FAQ.objects.create(question="Other?", answer="<p>Other.</p>")
+        FAQTranslation.objects.create(
+            faq=faq, language="hi", translated_text="परीक्षा?"
+        )
+        FAQTranslation.objects.create(faq=other, language="hi", translated_text="अन्य?")
+
+        view = FAQViewSet.as_view({"get": "list"})
+        request = api_rf.get("/faqs/", {"lang": "hi"})
+        response = view(request)
+        response.render()
+
+        expected = FAQSerializer(
+            FAQ.objects.all(), many=True, context={"request": Request(request)}
+        ).data
+        assert response.content == JSONRenderer().render(expected)
+
+    def test_list_falls_back_to_lazy_translation(self, api_rf, faq):
+        view = FAQViewSet.as_view({"get": "list"})
+        request = api_rf.get("/faqs/", {"lang": "hi"})
+
+        with patch.object(FAQ, "get_translated_question") as mock_translate:
+            mock_translate.return_value = "परीक्षा?"
+            response = view(request)
+
+        assert response.data == [
+            {"id": faq.pk, "question": "परीक्षा?", "answer": faq.answer}
+        ]
+        mock_translate.assert_called_once_with("hi")
+
+    def test_retrieve_serves_rendered_answer(self, api_rf):
+        faq = FAQ.objects.create(
+            question="Safe?", answer='<p onclick="x()">Yes</p><script>x()</script>'
+        )
+        FAQTranslation.objects.create(faq=faq, language="en", translated_text="Safe?")
+        view = FAQViewSet.as_view({"get": "retrieve"})
+        request = api_rf.get(f"/faqs/{faq.pk}/")
+
+        response = view(request, pk=faq.pk)
+        assert response.data["answer"] == "<p>Yes</p>"
+
+    def test_retrieve_missing_faq(self, api_rf):
+        view = FAQViewSet.as_view({"get": "retrieve"})
+        request = api_rf.get("/faqs/9999/")
+
+        response = view(request, pk=9999)
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.django_db
+def test_translation_status_endpoint(client, faq, django_assert_num_queries):
+    FAQTranslation.objects.create(faq=faq, language="hi", translated_text="परीक्षा?")
+
+    with patch.object(FAQ, "get_translated_question") as mock_translate:
+        response = client.get("/api/faqs/translation-status/")
+        # Second request is served from the cache
+        with django_assert_num_queries(0):
+            cached = client.get("/api/faqs/translation-status/")
+        mock_translate.assert_not_called()
+
+    assert response.status_code == status.HTTP_200_OK
+    assert cached.json() == response.json()
+    data = response.json()
+    assert data["total_faqs"] == 1
+    assert [row["language"] for row in data["languages"]] == (
+        settings.POPULAR_INDIAN_LANGUAGES
+    )
+    assert data["languages"][0]["translated"] == 1
+    assert len(data["oldest_missing"]) == len(settings.POPULAR_INDIAN_LANGUAGES) - 1
+
+
+@pytest.mark.django_db
+def test_translation_status_endpoint_is_site_scoped(client, faq):
+    cache.clear()
+    FAQ.objects.create(site="shop", question="Shop?", answer="Yes.")
+    FAQ.objects.create(site="shop", question="Other?", answer="No.")
+
+    shop = client.get("/api/faqs/translation-status/", {"site": "shop"}).json()
+    default = client.get("/api/faqs/translation-status/").json()
+
+    assert (shop["total_faqs"], default["total_faqs"]) == (2, 1)
+
+
+@pytest.mark.django_db
+class TestFAQWritePath:
+    def patch(self, api_rf, faq, data):
+        view = FAQViewSet.as_view({"patch": "partial_update"})
+        request = api_rf.patch(f"/faqs/{faq.pk}/", data, format="json")
+        return view(request, pk=faq.pk)
+
+    def test_noop_update_skips_everything(
+        self, api_rf, faq, write_probe, django_assert_num_queries
+    ):
+        version = get_cache_version()
+        write_probe["cache"].reset_mock()
+        # Only the SELECT of get_object()
+        with django_assert_num_queries(1):
+            response = self.patch(
+                api_rf, faq, {"question": faq.question, "answer": faq.answer}
+            )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["question"] == faq.question
+        assert write_probe["cache"].method_calls == []
+        assert write_probe["delay"].call_count == 0
+        write_probe["translator"].assert_not_called()
+        assert get_cache_version() == version
+
+    def test_noop_update_response_uses_stored_translation(
+        self, api_rf, faq, write_probe, django_assert_num_queries
+    ):
+        FAQTranslation.objects.create(faq=faq, language="hi", translated_text="हिं?")
+        view = FAQViewSet.as_view({"patch": "partial_update"})
+        request = api_rf.patch(
+            f"/faqs/{faq.pk}/?lang=hi", {"question": faq.question}, format="json"
+        )
+        # SELECT of get_object() and of the stored translation, no writes
+        with django_assert_num_queries(2):
+            response = view(request, pk=faq.pk)
+
+        assert response.data["question"] == "हिं?"
+        write_probe["translator"].assert_not_called()
+
+    def test_answer_only_update(
+        self, api_rf, faq, write_probe, django_assert_num_queries
+    ):
+        version = get_cache_version()
+        write_probe["cache"].reset_mock()
+        # SELECT + UPDATE of the answer columns
+        with django_assert_num_queries(2) as captured:
+            response = self.patch(api_rf, faq, {"answer": "<p>New.</p>"})
+
+        assert response.status_code == status.HTTP_200_OK
+        update_sql = captured.captured_queries[1]["sql"]
+        assert '"answer_html"' in update_sql
+        assert '"question"' not in update_sql
+        assert len(write_probe["cache"].method_calls) == 2  # version get + set
+        assert write_probe["delay"].call_count == 0
+        assert get_cache_version() == version + 1
+        faq.refresh_from_db()
+        assert faq.answer_html == "<p>New.</p>"
+        write_probe["translator"].assert_not_called()
+
+    def test_question_update_retranslates(
+        self, api_rf, faq, write_probe, django_assert_num_queries
+    ):
+        FAQTranslation.objects.create(faq=faq, language="hi", translated_text="old")
+        FAQTranslation.objects.create(faq=faq, language="fr", translated_text="old")
+
+        # SELECT, UPDATE, SELECT and DELETE of stale extra languages (loaded so
+        # post_delete can reschedule their snapshots), memory lookup
+        with django_assert_num_queries(5) as captured:
+            response = self.patch(api_rf, faq, {"question": "Changed?"})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert '"answer' not in captured.captured_queries[1]["sql"]
+        # Translation memory is looked up through the indexed question hash
+        assert '"question_hash"' in captured.captured_queries[4]["sql"]
+        assert not FAQTranslation.objects.filter(language="fr").exists()
+        assert write_probe["delay"].call_count == len(settings.POPULAR_INDIAN_LANGUAGES)
+        write_probe["delay"].assert_any_call(faq.pk, "hi", True)
+        write_probe["translator"].assert_not_called()
+
+    def test_create_reuses_translation_memory(self, api_rf, faq, write_probe):
+        FAQTranslation.objects.create(
+            faq=faq, language="hi", translated_text="परीक्षा?"
+        )
+        FAQTranslation.objects.create(faq=faq, language="bn", translated_text="")
+
+        view = FAQViewSet.as_view({"post": "create"})
+        request = api_rf.post(
+            "/faqs/", {"question": faq.question, "answer": "Other."}, format="json"
+        )
+        response = view(request)
+
+        assert response.status_code == status.HTTP_201_CREATED
+        created = FAQ.objects.get(pk=response.data["id"])
+        assert created.translations.get(language="hi").translated_text == "परीक्षा?"
+        queued = {call.args[1] for call in write_probe["delay"].call_args_list}
+        assert queued == set(settings.POPULAR_INDIAN_LANGUAGES) - {"hi"}
+        assert len(write_probe["cache"].method_calls) == 2
+        write_probe["translator"].assert_not_called()
+
+
+@pytest.mark.django_db
+class TestFAQSites:
+    @pytest.fixture(autouse=True)
+    def _no_translation(self, mocker):
+        mocker.patch.object(FAQ, "get_translated_question", lambda self, lang: "T?")
+        mocker.patch("faqs.views.translate_faq_language.delay_on_commit")
+
+    def test_list_reads_only_addressed_site(self, api_rf, faq):
+        other = FAQ.objects.create(site="shop", question="Shop?", answer="A.")
+        view = FAQViewSet.as_view({"get": "list"})
+
+        response = view(api_rf.get("/faqs/", {"site": "shop"}))
+        assert [row["id"] for row in response.data] == [other.pk]
+        response = view(api_rf.get("/faqs/"))
+        assert [row["id"] for row in response.data] == [faq.pk]
+
+    def test_retrieve_other_site_is_not_found(self, api_rf, faq):
+        view = FAQViewSet.as_view({"get": "retrieve"})
+        request = api_rf.get(f"/faqs/{faq.pk}/", {"site": "shop"})
+
+        assert view(request, pk=faq.pk).status_code == status.HTTP_404_NOT_FOUND
+
+    def test_invalid_site_is_rejected(self, api_rf):
+        view = FAQViewSet.as_view({"get": "list"})
+        response = view(api_rf.get("/faqs/", {"site": "not a slug"}))
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "site" in response.data
+
+    def test_create_lands_in_addressed_site(self, api_rf):
+        versions = get_cache_version(), get_cache_version("shop")
+        view = FAQViewSet.as_view({"post": "create"})
+        request = api_rf.post(
+            "/faqs/?site=shop", {"question": "Q?", "answer": "A."}, format="json"
+        )
+        response = view(request)
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert "site" not in response.data
+        assert FAQ.objects.get(pk=response.data["id"]).site == "shop"
+        assert (get_cache_version(), get_cache_version("shop")) == (
+            versions[0],
+            versions[1] + 1,
+        )
+
+    def test_write_invalidates_only_its_site(self, api_rf, faq):
+        assert get_cache_key("detail", faq.pk, "en") != get_cache_key(
+            "detail", faq.pk, "en", "shop"
+        )
+        other = FAQ.objects.create(site="shop", question="Shop?", answer="A.")
+        versions = get_cache_version(), get_cache_version("shop")
+        view = FAQViewSet.as_view({"patch": "partial_update"})
+        request = api_rf.patch(
+            f"/faqs/{other.pk}/?site=shop", {"answer": "B."}, format="json"
+        )
+
+        assert view(request, pk=other.pk).status_code == status.HTTP_200_OK
+        assert (get_cache_version(), get_cache_version("shop")) == (
+            versions[0],
+            versions[1] + 1,
+        )
+
+    def test_moving_faq_invalidates_both_sites(self, api_rf, faq):
+        versions = get_cache_version(), get_cache_version("shop")
+        view = FAQViewSet.as_view({"patch": "partial_update"})
+        request = api_rf.patch(f"/faqs/{faq.pk}/", {"site": "shop"}, format="json")
+
+        assert view(request, pk=faq.pk).status_code == status.HTTP_200_OK
+        faq.refresh_from_db()
+        assert faq.site == "shop"
+        assert (get_cache_version(), get_cache_version("shop")) == (
+            versions[0] + 1,
+            versions[1] + 1,
+        )
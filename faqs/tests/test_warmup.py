@@ -0,0 +1,68 @@
+import json
+import os
+import subprocess
+import sys
+from unittest.mock import patch
+
+import pytest
+from django.conf import settings as django_settings
+from django.core.cache import cache
+
+from faqs.caching import get_cache_key
+from faqs.compression import decompress_cache_body
+from faqs.models import FAQ, FAQTranslation
+from faqs.warmup import warm_app, warm_faq_details, warm_worker
+
+
+@pytest.mark.django_db
+def test_warm_faq_details_uses_stored_translations_only():
+    first = FAQ.objects.create(question="Help?", answer="<p>Here.</p>")
+    second = FAQ.objects.create(question="Other?", answer="<p>There.</p>")
+    FAQTranslation.objects.create(faq=first, language="hi", translated_text="मदद?")
+    FAQTranslation.objects.create(faq=second, language="hi", translated_text="अन्य?")
+
+    with patch.object(FAQ, "get_translated_question") as mock_translate:
+        assert warm_faq_details(limit=1) == 1
+        mock_translate.assert_not_called()
+
+    cached = cache.get(get_cache_key("detail", first.pk, "hi"))
+    assert json.loads(decompress_cache_body(cached)) == {
+        "id": first.pk,
+        "question": "मदद?",
+        "answer": "<p>Here.</p>",
+    }
+    assert cache.get(get_cache_key("detail", second.pk, "hi")) is None
+    assert FAQTranslation.objects.count() == 2
+
+
+@pytest.mark.django_db
+def test_warm_app_closes_connections(settings):
+    settings.FAQ_WARM_TOP_N = 5
+    FAQ.objects.create(question="Help?", answer="Here.")
+
+    with patch("faqs.warmup.connections.close_all") as close_all:
+        warm_app()
+
+    close_all.assert_called_once()
+
+
+def test_app_import_does_not_load_googletrans():
+    code = (
+        "import sys, django; django.setup(); import bharatfd.urls, faqs.tasks; "
+        "print('googletrans' in sys.modules)"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=django_settings.BASE_DIR,
+        env={**os.environ, "DJANGO_SETTINGS_MODULE": "bharatfd.test_settings"},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout.strip() == "False"
+
+
+def test_warm_worker_tolerates_cache_errors(caplog):
+    with patch("faqs.warmup.cache.get", side_effect=ConnectionError("down")):
+        warm_worker()
+    assert "Cache warm-up failed" in caplog.text
@@ -0,0 +1,11 @@
+def get_googletrans_client(*args, **kwargs):
+    """
+    Create a googletrans Translator.
+
+    googletrans pulls in its pinned httpx/h2 stack, which web workers that
+    only serve cached or stored translations never need, so it is imported on
+    first use instead of when the app loads.
+    """
+    from googletrans import Translator
+
+    return Translator(*args, **kwargs)
@@ -1,40 +1,50 @@
+import json
 import logging
 
 from django.conf import settings
 from django.core.cache import cache
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.core.validators import validate_slug
+from django.http import HttpResponse
+from django.utils.cache import patch_vary_headers
+from django.utils.http import parse_etags, quote_etag
 from rest_framework import status, viewsets
+from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
+from rest_framework.generics import get_object_or_404
+from rest_framework.renderers import JSONRenderer
 from rest_framework.response import Response
-
-from .models import FAQ
-from .serializers import FAQSerializer
-from .tasks import translate_faq_language
-
-CACHE_TIMEOUT = 60 * 15  # 15 minutes
-CACHE_VERSION_KEY = "faq_cache_version"
+from rest_framework.settings import api_settings
+
+from .caching import (
+    CACHE_TIMEOUT,
+    cache_faq_detail,
+    get_cache_key,
+    increment_cache_version,
+)
+from .compression import accepted_encodings, cache_body_size, decompress_cache_body
+from .models import DEFAULT_SITE, FAQ
+from .renderers import FastJSONRenderer
+from .reports import get_translation_status
+from .serializers import (
+    FAQSerializer,
+    faq_read_values,
+    serialize_faq_rows,
+    serialize_faq_write,
+)
+from .snapshots import delta_chain, get_snapshot_storage, get_snapshot_versions
+from .tasks import reuse_translations, translate_faq_language
+
+TRANSLATION_STATUS_CACHE_KEY = "faq_translation_status"
+TRANSLATION_STATUS_CACHE_TIMEOUT = 60  # 1 minute
 
 logger = logging.getLogger(__name__)
 
 
-# Cache utilities
-def get_cache_version():
-    version = cache.get(CACHE_VERSION_KEY)
-    return version or 1
-
-
-def increment_cache_version():
-    version = get_cache_version() + 1
-    cache.set(CACHE_VERSION_KEY, version)
-    return version
-
-
-def get_cache_key(resource_type, identifier, lang):
-    version = get_cache_version()
-    return f"faq_{resource_type}_{identifier}_{lang}_v{version}"
-
-
 class FAQViewSet(viewsets.ModelViewSet):
     queryset = FAQ.objects.all()
     serializer_class = FAQSerializer
+    renderer_classes = [FastJSONRenderer, *api_settings.DEFAULT_RENDERER_CLASSES]
 
     def _get_cached_or_fetch(self, cache_key, fetch_fn):
         if cached := cache.get(cache_key):
@@ -43,55 +53,161 @@ class FAQViewSet(viewsets.ModelViewSet):
         cache.set(cache_key, response.data, CACHE_TIMEOUT)
         return response
 
+    def get_site(self):
+        """The site partition a request addresses, `?site=` or the default."""
+        site = self.request.query_params.get("site", DEFAULT_SITE)
+        try:
+            validate_slug(site)
+        except DjangoValidationError as e:
+            raise ValidationError({"site": e.messages})
+        return site
+
+    def get_queryset(self):
+        return super().get_queryset().filter(site=self.get_site())
+
+    def _get_read_queryset(self):
+        # Reads skip the ModelSerializer and work on plain `.values()` rows
+        return faq_read_values(self.filter_queryset(self.get_queryset()))
+
     def list(self, request, *args, **kwargs):
         lang = request.query_params.get("lang", "en")
         logger.debug(f"Starting FAQ list request for {lang}")
         try:
-            return super().list(request, *args, **kwargs)
+            queryset = self._get_read_queryset()
+            page = self.paginate_queryset(queryset)
+            if page is not None:
+                return self.get_paginated_response(serialize_faq_rows(page, lang))
+            return Response(serialize_faq_rows(queryset, lang))
         except Exception as e:
             logger.error(f"List request failed for {lang}: {str(e)}", exc_info=True)
             raise
 
     def retrieve(self, request, *args, **kwargs):
         lang = request.query_params.get("lang", "en")
-        cache_key = get_cache_key("detail", kwargs["pk"], lang)
+        cache_key = get_cache_key("detail", kwargs["pk"], lang, self.get_site())
 
         if cached := cache.get(cache_key):
-            return Response(cached)
+            return self._cached_response(request, cached)
 
-        # Call the parent class's retrieve method directly
-        response = super(FAQViewSet, self).retrieve(request, *args, **kwargs)
-        cache.set(cache_key, response.data, CACHE_TIMEOUT)
-        return response
-
-    def _trigger_translations(self, faq_id):
-        for lang in settings.POPULAR_INDIAN_LANGUAGES:
-            translate_faq_language.delay_on_commit(faq_id, lang)
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        row = get_object_or_404(
+            self._get_read_queryset(),
+            **{self.lookup_field: kwargs[lookup_url_kwarg]},
+        )
+        data = serialize_faq_rows([row], lang)[0]
+        cache_faq_detail(data, lang, cache_key=cache_key)
+        return Response(data)
+
+    def _cached_response(self, request, cached):
+        # Cached bodies are gzipped compact JSON: gzip-capable JSON clients get
+        # the bytes as stored, everyone else goes through content negotiation.
+        # Bodies below COMPRESSION_MIN_SIZE go out uncompressed, as on a miss.
+        renderer = request.accepted_renderer
+        if (
+            cache_body_size(cached) >= settings.COMPRESSION_MIN_SIZE
+            and isinstance(renderer, JSONRenderer)
+            and request.accepted_media_type == renderer.media_type
+            and "gzip" in accepted_encodings(request)
+        ):
+            response = HttpResponse(cached, content_type=renderer.media_type)
+            response.headers["Content-Encoding"] = "gzip"
+            patch_vary_headers(response, ("Accept-Encoding",))
+            return response
+        return Response(json.loads(decompress_cache_body(cached)))
+
+    @action(detail=False, methods=["get"], url_path="translation-status")
+    def translation_status(self, request):
+        # Read-only report for ops; cached briefly, never triggers translation
+        site = self.get_site()
+        cache_key = f"{site}:{TRANSLATION_STATUS_CACHE_KEY}"
+        if cached := cache.get(cache_key):
+            return Response(cached)
+        data = get_translation_status(settings.POPULAR_INDIAN_LANGUAGES, site)
+        cache.set(cache_key, data, TRANSLATION_STATUS_CACHE_TIMEOUT)
+        return Response(data)
+
+    @action(detail=False, methods=["get"])
+    def snapshot(self, request):
+        """
+        Manifest of the offline snapshot for `?site=&lang=`. Pass the hash a
+        client holds as `?since=` to get the delta files leading to the
+        current version, oldest first; `deltas` is null when the client has
+        to download the full snapshot again.
+        """
+        lang = request.query_params.get("lang", "en")
+        versions = get_snapshot_versions(self.get_site(), lang)
+        if not versions:
+            return Response(
+                {"detail": "No snapshot for this language."},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+
+        current = versions[0]
+        etag = quote_etag(current["content_hash"])
+        if etag in parse_etags(request.headers.get("If-None-Match", "")):
+            return Response(status=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+        storage = get_snapshot_storage()
+
+        def url(name):
+            return request.build_absolute_uri(storage.url(name))
+
+        data = {
+            "version": current["version"],
+            "hash": current["content_hash"],
+            "url": url(current["file"]),
+            "size": current["size"],
+        }
+        if since := request.query_params.get("since"):
+            chain = delta_chain(versions, since)
+            data["deltas"] = None if chain is None else [url(name) for name in chain]
+        return Response(data, headers={"ETag": etag})
+
+    def _trigger_translations(self, faq, force=False):
+        # Languages already known for this exact question are copied, not queued
+        languages = settings.POPULAR_INDIAN_LANGUAGES
+        reused = reuse_translations(faq, languages)
+        for lang in languages:
+            if lang not in reused:
+                translate_faq_language.delay_on_commit(faq.id, lang, force)
 
     def _handle_update(self, request, partial):
         instance = self.get_object()
-        old_question = instance.question
         serializer = self.get_serializer(instance, data=request.data, partial=partial)
         serializer.is_valid(raise_exception=True)
-        self.perform_update(serializer)
-
-        if old_question != serializer.instance.question:
-            self._trigger_translations(serializer.instance.id)
+        changed = serializer.get_changed_fields()
+        if not changed:
+            # Nothing to write, invalidate or translate
+            return self._write_response(instance)
 
-        increment_cache_version()
-        return Response(serializer.data)
+        old_site = instance.site
+        self.perform_update(serializer)
+        if "question" in changed:
+            # Lazily created translations outside the popular set are stale too
+            instance.translations.exclude(
+                language__in=settings.POPULAR_INDIAN_LANGUAGES
+            ).delete()
+            self._trigger_translations(instance, force=True)
+
+        # Moving an FAQ between sites invalidates both partitions
+        for site in {old_site, instance.site}:
+            increment_cache_version(site)
+        return self._write_response(instance)
 
     def create(self, request, *args, **kwargs):
         serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
         self.perform_create(serializer)
-        self._trigger_translations(serializer.instance.id)
-        increment_cache_version()
+        self._trigger_translations(serializer.instance)
+        increment_cache_version(serializer.instance.site)
+        return self._write_response(serializer.instance, status.HTTP_201_CREATED)
 
-        headers = self.get_success_headers(serializer.data)
-        return Response(
-            serializer.data, status=status.HTTP_201_CREATED, headers=headers
-        )
+    def _write_response(self, faq, status_code=status.HTTP_200_OK):
+        # Built from stored data: FAQSerializer.data would translate inline
+        lang = self.request.query_params.get("lang", "en")
+        data = serialize_faq_write(faq, lang)
+        headers = self.get_success_headers(data)
+        return Response(data, status=status_code, headers=headers)
 
     def update(self, request, *args, **kwargs):
         return self._handle_update(request, partial=False)
@@ -99,7 +215,12 @@ class FAQViewSet(viewsets.ModelViewSet):
     def partial_update(self, request, *args, **kwargs):
         return self._handle_update(request, partial=True)
 
+    def perform_create(self, serializer):
+        # FAQs created without a "site" field land in the addressed partition
+        serializer.save(site=serializer.validated_data.get("site", self.get_site()))
+
     def destroy(self, request, *args, **kwargs):
-        super().destroy(request, *args, **kwargs)
-        increment_cache_version()
+        instance = self.get_object()
+        self.perform_destroy(instance)
+        increment_cache_version(instance.site)
         return Response(status=status.HTTP_204_NO_CONTENT)
@@ -0,0 +1,57 @@
+"""Boot-time warm-up for gunicorn (see gunicorn.conf.py)."""
+
+import logging
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connections
+from django.urls import reverse
+
+from .caching import CACHE_VERSION_KEY, cache_faq_detail
+from .models import FAQ
+from .serializers import faq_read_values, faq_row_data, get_translation_map
+
+logger = logging.getLogger(__name__)
+
+
+def warm_faq_details(limit):
+    """
+    Cache the detail payloads of the first `limit` FAQs in every language
+    they already have a stored translation for. Never triggers translation.
+    """
+    rows = list(faq_read_values(FAQ.objects.order_by("pk"), "site")[:limit])
+    faq_ids = [row["id"] for row in rows]
+    warmed = 0
+    for lang in ["en", *settings.POPULAR_INDIAN_LANGUAGES]:
+        translations = get_translation_map(faq_ids, lang)
+        for row in rows:
+            if row["id"] in translations:
+                data = faq_row_data(row, translations[row["id"]])
+                cache_faq_detail(data, lang, row["site"])
+                warmed += 1
+    return warmed
+
+
+def warm_app():
+    """
+    Run in the gunicorn master after the app is preloaded, so the work is
+    shared copy-on-write by every worker forked afterwards.
+    """
+    # Resolving a URL imports the URLconf: admin, DRF and the FAQ views
+    reverse("faq-list")
+    if settings.FAQ_WARM_TOP_N:
+        try:
+            warmed = warm_faq_details(settings.FAQ_WARM_TOP_N)
+            logger.info(f"Warmed {warmed} FAQ detail payloads")
+        except Exception as e:
+            logger.warning(f"FAQ payload warm-up failed: {str(e)}")
+    # Workers must open their own database connections
+    connections.close_all()
+
+
+def warm_worker():
+    """Run in each worker after fork: open its cache connection pool."""
+    try:
+        cache.get(CACHE_VERSION_KEY)
+    except Exception as e:
+        logger.warning(f"Cache warm-up failed: {str(e)}")
@@ -1,3 +1,21 @@
 bind = "0.0.0.0:8000"
 workers = 4
 timeout = 120
+
+# Load Django once in the master so workers share it copy-on-write instead of
+# each repeating the setup after fork
+preload_app = True
+
+
+def when_ready(server):
+    if server.cfg.preload_app:
+        from faqs.warmup import warm_app
+
+        warm_app()
+
+
+def post_fork(server, worker):
+    if server.cfg.preload_app:
+        from faqs.warmup import warm_worker
+
+        warm_worker()